@@ -19,6 +19,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 from typing import Any
 
 from src.agents.base import BaseAgent, AgentContext
@@ -794,35 +795,42 @@ _COMMODITY_KEYWORDS = {
 }
 
 
-def _is_macro_news(item: dict) -> bool:
-    text = (
+def _compile_keywords(keywords: set[str]) -> re.Pattern[str]:
+    """Compile a keyword set into one alternation matched in a single scan.
+
+    Equivalent to ``any(kw in text for kw in keywords)`` but walks the text
+    once instead of once per keyword.
+    """
+    return re.compile("|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+
+_MACRO_RE = _compile_keywords(_MACRO_KEYWORDS)
+_CRYPTO_RE = _compile_keywords(_CRYPTO_KEYWORDS)
+_COMMODITY_RE = _compile_keywords(_COMMODITY_KEYWORDS)
+
+
+def _news_text(item: dict) -> str:
+    return (
         item.get("headline", "") + " " +
         item.get("summary", "") + " " +
         item.get("title", "")
     ).lower()
-    return any(kw in text for kw in _MACRO_KEYWORDS)
+
+
+def _is_macro_news(item: dict) -> bool:
+    return _MACRO_RE.search(_news_text(item)) is not None
 
 
 def _is_crypto_news(item: dict) -> bool:
-    text = (
-        item.get("headline", "") + " " +
-        item.get("summary", "") + " " +
-        item.get("title", "")
-    ).lower()
-    return any(kw in text for kw in _CRYPTO_KEYWORDS)
+    return _CRYPTO_RE.search(_news_text(item)) is not None
 
 
 def _is_crypto_text(text: str) -> bool:
-    return any(kw in text.lower() for kw in _CRYPTO_KEYWORDS)
+    return _CRYPTO_RE.search(text.lower()) is not None
 
 
 def _is_commodity_news(item: dict) -> bool:
-    text = (
-        item.get("headline", "") + " " +
-        item.get("summary", "") + " " +
-        item.get("title", "")
-    ).lower()
-    return any(kw in text for kw in _COMMODITY_KEYWORDS)
+    return _COMMODITY_RE.search(_news_text(item)) is not None
 
 
 def _truncate_json(obj: Any, max_chars: int = 4000) -> str:
@@ -644,6 +644,8 @@ async def trigger_data_pipeline():
     try:
         from src.services.data_pipeline import data_pipeline
         if data_pipeline is not None:
+            # An explicit trigger should bypass the snapshot cache.
+            data_pipeline.invalidate()
             snapshot = await data_pipeline.collect()
             sources_queried = len(snapshot.sources) if hasattr(snapshot, "sources") else 3
             new_entries = len(snapshot.news_items) if snapshot.news_items else 0
@@ -404,27 +404,7 @@ async def get_price_cache_status():
     from src.services.price_cache import PriceCacheService
 
     cache = PriceCacheService.get_instance()
-    all_prices = cache.get_all_prices()
-    prices_dict = {
-        ticker: {
-            "price": cp.price,
-            "prev_close": cp.prev_close,
-            "change": cp.change,
-            "change_pct": cp.change_pct,
-            "volume": cp.volume,
-            "updated_at": cp.updated_at.isoformat() + "Z",
-        }
-        for ticker, cp in all_prices.items()
-    }
-    return PriceCacheStatus(
-        tickers_cached=len(all_prices),
-        last_refresh=(
-            cache.last_refresh.isoformat() + "Z" if cache.last_refresh else None
-        ),
-        is_refreshing=cache.is_refreshing,
-        refresh_interval_seconds=cache.refresh_interval,
-        prices=prices_dict,
-    )
+    return PriceCacheStatus(**cache.get_status(), prices=cache.get_prices_payload())
 
 
 # ---------------------------------------------------------------------------
@@ -46,6 +46,11 @@ class Settings(BaseSettings):
     rl_batch_size: int = 64
     rl_learning_rate: float = 0.001
 
+    # Backtesting: directory for cached OHLCV parquet files ("" disables)
+    backtest_cache_dir: str = ".cache/backtest"
+    # Price cache snapshot reloaded on restart so it starts warm ("" disables)
+    price_cache_file: str = ".cache/price_cache.json"
+
     # Auth
     jwt_secret: str = "overture-change-me-in-production-2026"
 
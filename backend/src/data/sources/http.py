@@ -0,0 +1,62 @@
+"""
+Shared HTTP client for the data source connectors.
+
+RSS, Reddit and Substack fetches fan out to a dozen or so hosts on every
+pipeline run.  Opening a fresh ``aiohttp.ClientSession`` per request throws
+away the connection each time, so every fetch repays DNS, TCP and TLS
+setup.  Connectors instead borrow one pooled session from ``get_session``
+and pass their own per-request ``timeout``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+_http_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared keep-alive session, creating it on first use.
+
+    The session is bound to the running event loop; if it was created on a
+    loop that is no longer current (e.g. a script calling ``asyncio.run``
+    twice) a new one is built.
+    """
+
+    global _http_session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            # RSS feeds and subreddits fan out to ~15 hosts; a handful of
+            # sockets per host is enough for the concurrent gathers.
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        _http_session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": "Overture/1.0"},
+        )
+        _session_loop = loop
+        logger.debug("Created shared aiohttp session")
+    return _http_session
+
+
+async def close_session() -> None:
+    """Close the shared session (called on application shutdown)."""
+
+    global _http_session, _session_loop
+
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+    _session_loop = None
@@ -19,6 +19,7 @@ import aiohttp
 import feedparser
 
 from src.data.sources.base import BaseDataSource, DataItem
+from src.data.sources.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,10 @@ class RSSNewsSource(BaseDataSource):
         super().__init__(name="rss_news", source_type="news")
         self.feeds: list[str] = feeds or list(DEFAULT_FEEDS)
         self.request_timeout = request_timeout
+        # Per-feed HTTP validators (ETag, Last-Modified) and the items parsed
+        # from the last full response, for conditional GETs.
+        self._validators: dict[str, tuple[str | None, str | None]] = {}
+        self._feed_items: dict[str, list[DataItem]] = {}
 
     # ------------------------------------------------------------------
     # BaseDataSource interface
@@ -119,6 +124,9 @@ class RSSNewsSource(BaseDataSource):
 
         logger.debug("Fetching RSS feed: %s", url)
         raw_xml = await self._download(url)
+        if raw_xml is None:
+            # 304 Not Modified — reuse what we parsed last time.
+            return self._feed_items.get(url, [])
         if not raw_xml:
             return []
 
@@ -160,22 +168,40 @@ class RSSNewsSource(BaseDataSource):
                 )
             )
 
+        self._feed_items[url] = items
         return items
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    async def _download(self, url: str) -> str:
-        """Download raw feed content via aiohttp."""
+    async def _download(self, url: str) -> str | None:
+        """Download raw feed content via aiohttp.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` when the feed was
+        fetched before and returns ``None`` if the server answers 304.
+        Returns ``""`` on failure.
+        """
+        headers: dict[str, str] = {}
+        etag, last_modified = self._validators.get(url, (None, None))
+        if url in self._feed_items:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         try:
             timeout = aiohttp.ClientTimeout(total=self.request_timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers={"User-Agent": "Overture/1.0"}) as resp:
-                    if resp.status != 200:
-                        logger.warning("Non-200 status %d from %s", resp.status, url)
-                        return ""
-                    return await resp.text()
+            session = await get_session()
+            async with session.get(url, headers=headers, timeout=timeout) as resp:
+                if resp.status == 304:
+                    return None
+                if resp.status != 200:
+                    logger.warning("Non-200 status %d from %s", resp.status, url)
+                    return ""
+                self._validators[url] = (
+                    resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+                )
+                return await resp.text()
         except Exception:
             logger.warning("Failed to download feed %s", url, exc_info=True)
             return ""
@@ -17,6 +17,7 @@ from typing import Any
 import aiohttp
 
 from src.data.sources.base import BaseDataSource, DataItem
+from src.data.sources.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -215,15 +216,15 @@ class RedditSource(BaseDataSource):
         try:
             timeout = aiohttp.ClientTimeout(total=self.request_timeout)
             headers = {"User-Agent": "Overture/1.0 (financial research bot)"}
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, params=params, headers=headers) as resp:
-                    if resp.status == 429:
-                        logger.warning("Reddit rate-limited on %s", url)
-                        return None
-                    if resp.status != 200:
-                        logger.warning("Non-200 status %d from %s", resp.status, url)
-                        return None
-                    return await resp.json()
+            session = await get_session()
+            async with session.get(url, params=params, headers=headers, timeout=timeout) as resp:
+                if resp.status == 429:
+                    logger.warning("Reddit rate-limited on %s", url)
+                    return None
+                if resp.status != 200:
+                    logger.warning("Non-200 status %d from %s", resp.status, url)
+                    return None
+                return await resp.json()
         except Exception:
             logger.warning("Request to %s failed", url, exc_info=True)
             return None
@@ -26,6 +26,7 @@ import feedparser
 
 from src.config import settings
 from src.data.sources.base import BaseDataSource, DataItem
+from src.data.sources.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +84,7 @@ class SocialAggregatorSource(BaseDataSource):
         enabled_platforms: Subset of platforms to activate.  Accepted values
             are ``"twitter"``, ``"substack"``, and ``"youtube"``.  Defaults
             to all three.
+        request_timeout: Per-request HTTP timeout in seconds.
     """
 
     SUPPORTED_PLATFORMS = ("twitter", "substack", "youtube")
@@ -90,9 +92,11 @@ class SocialAggregatorSource(BaseDataSource):
     def __init__(
         self,
         enabled_platforms: list[str] | None = None,
+        request_timeout: float = 15.0,
     ) -> None:
         super().__init__(name="social_aggregator", source_type="social")
         self.enabled_platforms: list[str] = enabled_platforms or list(self.SUPPORTED_PLATFORMS)
+        self.request_timeout = request_timeout
 
     # ------------------------------------------------------------------
     # BaseDataSource interface
@@ -242,20 +246,20 @@ class SocialAggregatorSource(BaseDataSource):
         }
 
         try:
-            timeout = aiohttp.ClientTimeout(total=15.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, params=params, headers=headers) as resp:
-                    if resp.status == 429:
-                        logger.warning("X API rate-limited (429)")
-                        return []
-                    if resp.status == 401:
-                        logger.error("X API auth failed (401) — check X_BEARER_TOKEN")
-                        return []
-                    if resp.status != 200:
-                        body = await resp.text()
-                        logger.warning("X API error %d: %s", resp.status, body[:200])
-                        return []
-                    data = await resp.json()
+            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            session = await get_session()
+            async with session.get(url, params=params, headers=headers, timeout=timeout) as resp:
+                if resp.status == 429:
+                    logger.warning("X API rate-limited (429)")
+                    return []
+                if resp.status == 401:
+                    logger.error("X API auth failed (401) — check X_BEARER_TOKEN")
+                    return []
+                if resp.status != 200:
+                    body = await resp.text()
+                    logger.warning("X API error %d: %s", resp.status, body[:200])
+                    return []
+                data = await resp.json()
         except Exception:
             logger.warning("X API request failed", exc_info=True)
             return []
@@ -579,13 +583,13 @@ class SocialAggregatorSource(BaseDataSource):
     async def _download(self, url: str) -> str:
         """Download raw content via aiohttp."""
         try:
-            timeout = aiohttp.ClientTimeout(total=15.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers={"User-Agent": "Overture/1.0"}) as resp:
-                    if resp.status != 200:
-                        logger.warning("Non-200 status %d from %s", resp.status, url)
-                        return ""
-                    return await resp.text()
+            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            session = await get_session()
+            async with session.get(url, timeout=timeout) as resp:
+                if resp.status != 200:
+                    logger.warning("Non-200 status %d from %s", resp.status, url)
+                    return ""
+                return await resp.text()
         except Exception:
             logger.warning("Failed to download %s", url, exc_info=True)
             return ""
@@ -0,0 +1,26 @@
+"""
+Process-wide serialisation of ``yf.download``.
+
+``yf.download`` gathers per-ticker frames and errors in module-level dicts
+(``yfinance.shared``) that every call resets on entry, so two calls running
+at once on different threads can drop or mix up each other's results.  The
+price cache refresh, on-demand price lookups, the data pipeline's market
+collector, backtests and the validation tools all download from worker
+threads, so they go through ``download`` to run one at a time.
+``Ticker.history`` does not reset that state and needs no lock.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import yfinance as yf
+
+_download_lock = threading.Lock()
+
+
+def download(*args: Any, **kwargs: Any) -> Any:
+    """``yf.download`` under the process-wide download lock."""
+    with _download_lock:
+        return yf.download(*args, **kwargs)
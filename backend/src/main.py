@@ -62,6 +62,12 @@ async def lifespan(app: FastAPI):
         except Exception as exc:
             logger.error("Knowledge upload columns migration FAILED: %s", exc, exc_info=True)
 
+        # Add the full-text search column + retrieval indexes to knowledge_entries
+        try:
+            await _migrate_knowledge_search_indexes()
+        except Exception as exc:
+            logger.error("Knowledge search index migration FAILED: %s", exc, exc_info=True)
+
         # Seed sample knowledge articles (idempotent)
         try:
             await _seed_knowledge_articles()
@@ -95,6 +101,13 @@ async def lifespan(app: FastAPI):
     if _agent_engine_ok and agent_engine is not None:
         await agent_engine.shutdown()
 
+    # Shutdown: release pooled connections held by the data source connectors
+    try:
+        from src.data.sources.http import close_session
+        await close_session()
+    except Exception as exc:
+        logger.warning("HTTP session cleanup failed: %s", exc)
+
 
 async def _seed_master_user() -> None:
     """Create or reset the master admin account.
@@ -217,6 +230,32 @@ async def _migrate_knowledge_upload_cols() -> None:
         await session.commit()
 
 
+async def _migrate_knowledge_search_indexes() -> None:
+    """Add the search_vector column and the knowledge retrieval indexes if missing."""
+    from sqlalchemy import text
+    from src.models.knowledge import KNOWLEDGE_SEARCH_VECTOR_SQL
+
+    async with async_session_factory() as session:
+        await session.execute(text(
+            "ALTER TABLE knowledge_entries ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({KNOWLEDGE_SEARCH_VECTOR_SQL}) STORED"
+        ))
+        await session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_knowledge_entries_search_vector "
+            "ON knowledge_entries USING gin (search_vector)"
+        ))
+        await session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_knowledge_entries_tickers "
+            "ON knowledge_entries USING gin ((tickers::jsonb))"
+        ))
+        await session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_knowledge_entries_public_ranking "
+            "ON knowledge_entries (source_credibility_score DESC, created_at DESC) "
+            "WHERE is_public"
+        ))
+        await session.commit()
+
+
 async def _seed_knowledge_articles() -> None:
     """Seed the knowledge library with real investment research articles (idempotent)."""
     from sqlalchemy import select, func
@@ -8,8 +8,10 @@ import enum
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, Enum, Float, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import (
+    Boolean, Computed, Enum, Float, ForeignKey, Index, String, Text, func, text,
+)
+from sqlalchemy.dialects.postgresql import JSON, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.base import Base
@@ -42,6 +44,13 @@ class OutlookSentiment(str, enum.Enum):
     BEARISH = "bearish"
 
 
+# Full-text document for knowledge search; shared with the startup migration
+# in src/main.py that adds the column to pre-existing databases.
+KNOWLEDGE_SEARCH_VECTOR_SQL = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))"
+)
+
+
 class KnowledgeEntry(Base):
     """A curated piece of market knowledge or research.
 
@@ -51,6 +60,28 @@ class KnowledgeEntry(Base):
     """
 
     __tablename__ = "knowledge_entries"
+    __table_args__ = (
+        Index(
+            "ix_knowledge_entries_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        # tickers is plain JSON; index its jsonb cast so ``?|`` lookups
+        # (see knowledge_rag.get_context) are served by a bitmap index scan.
+        Index(
+            "ix_knowledge_entries_tickers",
+            text("(tickers::jsonb)"),
+            postgresql_using="gin",
+        ),
+        # Matches get_context's is_public filter and ORDER BY, so the
+        # ranked LIMIT is a top-N index scan instead of a sort.
+        Index(
+            "ix_knowledge_entries_public_ranking",
+            text("source_credibility_score DESC"),
+            text("created_at DESC"),
+            postgresql_where=text("is_public"),
+        ),
+    )
 
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -92,6 +123,15 @@ class KnowledgeEntry(Base):
     file_name: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     file_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
+    # Generated tsvector over title + content, GIN-indexed for keyword search.
+    # Deferred so ordinary entry loads don't pull it over the wire.
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(KNOWLEDGE_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+        deferred=True,
+    )
+
     def __repr__(self) -> str:
         return (
             f"<KnowledgeEntry(id={self.id!r}, title={self.title!r}, "
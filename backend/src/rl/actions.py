@@ -331,7 +331,7 @@ def _available_idea_generator_actions(state: dict[str, Any]) -> list[dict[str, A
     actions: list[dict[str, Any]] = []
 
     # News-based generation available when there are recent news items
-    if state.get("recent_news_embeddings") or state.get("has_news", True):
+    if len(state.get("recent_news_embeddings", ())) or state.get("has_news", True):
         actions.append({"type": IdeaGeneratorAction.GENERATE_FROM_NEWS.value, "parameters": {}})
 
     # Screen-based generation is always available
@@ -12,9 +12,10 @@ evicted when the buffer is full, keeping the training data fresh.
 from __future__ import annotations
 
 import random
+import sys
+import time
 from collections import deque
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from itertools import islice
 from typing import Any
 
 from src.utils.logging import get_logger
@@ -22,10 +23,12 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
 class Experience:
     """A single RL experience tuple recorded during agent operation.
 
+    A plain ``__slots__`` class rather than a dataclass: one is built per
+    recorded step, so the constructor is kept to direct attribute stores.
+
     Attributes:
         episode_id: Identifier of the episode this experience belongs to.
         step: The step number within the episode.
@@ -35,20 +38,68 @@ class Experience:
         reward: The scalar reward received after the action.
         next_state: The observation after the action was executed.
         done: Whether the episode terminated after this step.
-        metadata: Additional information (e.g. reward breakdown, latency).
-        timestamp: When this experience was recorded.
+        metadata: Additional information (e.g. reward breakdown, latency),
+            or ``None`` when there is none.
+        timestamp: When this experience was recorded (Unix epoch seconds);
+            defaults to now.
+        action_type: Interned ``action["type"]`` (``"unknown"`` when
+            absent); filled in automatically when not given.
     """
 
-    episode_id: str
-    step: int
-    agent_name: str
-    state: dict[str, Any]
-    action: dict[str, Any]
-    reward: float
-    next_state: dict[str, Any]
-    done: bool
-    metadata: dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    __slots__ = (
+        "episode_id",
+        "step",
+        "agent_name",
+        "state",
+        "action",
+        "reward",
+        "next_state",
+        "done",
+        "metadata",
+        "timestamp",
+        "action_type",
+    )
+
+    def __init__(
+        self,
+        episode_id: str,
+        step: int,
+        agent_name: str,
+        state: dict[str, Any],
+        action: dict[str, Any],
+        reward: float,
+        next_state: dict[str, Any],
+        done: bool,
+        metadata: dict[str, Any] | None = None,
+        timestamp: float | None = None,
+        action_type: str = "",
+    ) -> None:
+        self.episode_id = episode_id
+        self.step = step
+        self.agent_name = agent_name
+        self.state = state
+        self.action = action
+        self.reward = reward
+        self.next_state = next_state
+        self.done = done
+        self.metadata = metadata
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.action_type = action_type or sys.intern(str(action.get("type", "unknown")))
+
+    def _asdict(self) -> dict[str, Any]:
+        """Return the experience's fields as a dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Experience):
+            return NotImplemented
+        return self._asdict() == other._asdict()
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Experience({fields})"
 
 
 class ReplayBuffer:
@@ -65,6 +116,10 @@ class ReplayBuffer:
     def __init__(self, max_size: int = 10000) -> None:
         self.max_size = max_size
         self._buffer: deque[Experience] = deque(maxlen=max_size)
+        # Per-agent views in insertion order.  The global deque always
+        # evicts its oldest entry, which is also the oldest entry of that
+        # agent's view, so eviction is a popleft on one view.
+        self._agent_buffers: dict[str, deque[Experience]] = {}
 
     # ------------------------------------------------------------------
     # Public interface
@@ -79,7 +134,17 @@ class ReplayBuffer:
         Args:
             experience: The experience to store.
         """
+        if len(self._buffer) == self.max_size:
+            evicted = self._buffer[0].agent_name
+            agent_buffer = self._agent_buffers[evicted]
+            agent_buffer.popleft()
+            if not agent_buffer:
+                del self._agent_buffers[evicted]
         self._buffer.append(experience)
+        agent_buffer = self._agent_buffers.get(experience.agent_name)
+        if agent_buffer is None:
+            agent_buffer = self._agent_buffers[experience.agent_name] = deque()
+        agent_buffer.append(experience)
 
     def sample(self, batch_size: int) -> list[Experience]:
         """Sample a uniformly random batch of experiences.
@@ -95,6 +160,23 @@ class ReplayBuffer:
         k = min(batch_size, len(self._buffer))
         return random.sample(list(self._buffer), k)
 
+    def sample_agent(self, agent_name: str, batch_size: int) -> list[Experience]:
+        """Sample a uniformly random batch of one agent's experiences.
+
+        Args:
+            agent_name: The agent to sample for.
+            batch_size: Number of experiences to sample.
+
+        Returns:
+            Up to *batch_size* randomly sampled experiences belonging to
+            *agent_name*, without touching other agents' entries.
+        """
+        agent_buffer = self._agent_buffers.get(agent_name)
+        if not agent_buffer:
+            return []
+        k = min(batch_size, len(agent_buffer))
+        return random.sample(list(agent_buffer), k)
+
     def sample_prioritized(
         self, batch_size: int, alpha: float = 0.6
     ) -> list[Experience]:
@@ -152,6 +234,7 @@ class ReplayBuffer:
     def clear(self) -> None:
         """Remove all experiences from the buffer."""
         self._buffer.clear()
+        self._agent_buffers.clear()
 
     def get_stats(self) -> dict[str, Any]:
         """Return summary statistics about the buffer contents.
@@ -226,6 +309,14 @@ class ReplayBuffer:
             "episodes": episodes,
         }
 
+    def agent_count(self, agent_name: str) -> int:
+        """Return how many buffered experiences belong to *agent_name*."""
+        return len(self._agent_buffers.get(agent_name, ()))
+
+    def agent_names(self) -> set[str]:
+        """Return the names of agents with at least one buffered experience."""
+        return set(self._agent_buffers)
+
     def get_agent_experiences(
         self, agent_name: str, limit: int = 100
     ) -> list[Experience]:
@@ -239,8 +330,7 @@ class ReplayBuffer:
             A list of up to *limit* experiences for the given agent,
             ordered from most recent to oldest.
         """
-        matching = [
-            exp for exp in reversed(self._buffer)
-            if exp.agent_name == agent_name
-        ]
-        return matching[:limit]
+        agent_buffer = self._agent_buffers.get(agent_name)
+        if not agent_buffer:
+            return []
+        return list(islice(reversed(agent_buffer), limit))
@@ -21,6 +21,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -35,13 +37,6 @@ def _clip(value: float, lo: float = -1.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, value))
 
 
-def _safe_div(numerator: float, denominator: float, default: float = 0.0) -> float:
-    """Return *numerator / denominator*, or *default* when division is undefined."""
-    if denominator == 0.0:
-        return default
-    return numerator / denominator
-
-
 def _normalize_pct(value: float, scale: float = 100.0) -> float:
     """Convert a percentage to a [-1, 1] range given an expected *scale*."""
     return _clip(value / scale, -1.0, 1.0)
@@ -54,6 +49,80 @@ def _normalize_zscore(value: float, mean: float, std: float) -> float:
     return _clip((value - mean) / std, -3.0, 3.0)
 
 
+_REGIME_KEYS: tuple[str, ...] = (
+    "vix",
+    "trend_strength",
+    "breadth",
+    "volatility_regime",
+    "momentum_regime",
+    "risk_on",
+)
+
+
+def _extract_regime(regime: dict[str, Any]) -> tuple[Any, ...]:
+    """Pull every :data:`_REGIME_KEYS` field out of *regime* in one pass.
+
+    ``regime.get`` is bound once so the six lookups avoid repeated
+    attribute resolution; missing keys fall back to neutral defaults.
+    """
+    get = regime.get
+    return (
+        get("vix", 20.0),
+        get("trend_strength", 0.0),
+        get("breadth", 0.5),
+        get("volatility_regime", 0.0),
+        get("momentum_regime", 0.0),
+        get("risk_on", True),
+    )
+
+
+def _encode_market_regime(regime: dict[str, Any], compact: bool = False) -> dict[str, float]:
+    """Normalise a raw market-regime dict.
+
+    Returns all six regime features, or only ``vix_level``,
+    ``trend_strength`` and ``risk_on`` when *compact* is true.
+    """
+    vix, trend, breadth, vol_regime, mom_regime, risk_on = _extract_regime(regime)
+    if compact:
+        return {
+            "vix_level": _normalize_pct(vix - 20.0, scale=30.0),
+            "trend_strength": _clip(trend, -1.0, 1.0),
+            "risk_on": float(bool(risk_on)),
+        }
+    return {
+        "vix_level": _normalize_pct(vix - 20.0, scale=30.0),
+        "trend_strength": _clip(trend, -1.0, 1.0),
+        "breadth": _clip(breadth, 0.0, 1.0),
+        "volatility_regime": _clip(vol_regime, -1.0, 1.0),
+        "momentum_regime": _clip(mom_regime, -1.0, 1.0),
+        "risk_on": float(bool(risk_on)),
+    }
+
+
+def _group_sector_weights(
+    positions: list[dict[str, Any]],
+) -> tuple[dict[str, int], np.ndarray]:
+    """Sum position weights per ``asset_class`` into a flat array.
+
+    Returns ``(slots, totals)`` where *slots* maps each sector to its
+    index in *totals*, in first-seen order.  Positions without an
+    ``asset_class`` are grouped under ``"unknown"``.
+    """
+    if not positions:
+        return {}, np.zeros(0)
+
+    slots: dict[str, int] = {}
+    idx: list[int] = []
+    weights: list[float] = []
+    for pos in positions:
+        get = pos.get
+        idx.append(slots.setdefault(get("asset_class", "unknown"), len(slots)))
+        weights.append(get("weight", 0.0))
+    totals = np.zeros(len(slots))
+    np.add.at(totals, idx, weights)
+    return slots, totals
+
+
 # ---------------------------------------------------------------------------
 # StateEncoder
 # ---------------------------------------------------------------------------
@@ -68,9 +137,21 @@ class StateEncoder:
 
     The encoder is stateless -- all normalisation parameters (means,
     stds, reference prices) must be present in the input data or in
-    the optional ``config`` dict passed at construction time.
+    the optional ``config`` dict passed at construction time.  The only
+    per-instance scratch space is a preallocated float32 output buffer
+    reused by the vector encoders.
     """
 
+    __slots__ = (
+        "config",
+        "_sentiment_scale",
+        "_volume_avg_window",
+        "_max_positions",
+        "_max_sectors",
+        "_embedding_dim",
+        "_out_buf",
+    )
+
     def __init__(self, config: dict[str, Any] | None = None):
         self.config = config or {}
 
@@ -79,6 +160,9 @@ class StateEncoder:
         self._volume_avg_window: int = self.config.get("volume_avg_window", 20)
         self._max_positions: int = self.config.get("max_positions", 50)
         self._max_sectors: int = self.config.get("max_sectors", 11)  # GICS sectors
+        self._embedding_dim: int = self.config.get("embedding_dim", 384)
+
+        self._out_buf: np.ndarray = np.empty(len(TRADE_MONITOR_FEATURES), dtype=np.float32)
 
     # ==================================================================
     # 1.  Idea Generator
@@ -96,31 +180,30 @@ class StateEncoder:
         unusual moves, and trending social topics.
 
         Returns a dict with keys:
-        - ``recent_news_embeddings``: list of embedding vectors (or
-          empty list if unavailable).
+        - ``recent_news_embeddings``: ``(N, D)`` float32 array of
+          embedding vectors (``N == 0`` if unavailable).
         - ``market_regime``: dict with normalised regime indicators.
         - ``sector_momentum``: dict mapping sector names to momentum z-scores.
         - ``unusual_moves``: list of dicts describing anomalous tickers.
         - ``trending_topics``: list of topic strings with associated scores.
         """
-        # -- recent news embeddings (pass through; downstream can truncate) --
+        # -- recent news embeddings (stacked once so the policy can
+        #    wrap the matrix without another copy) --
         raw_news = knowledge_state.get("recent_news", [])
-        news_embeddings: list[list[float]] = []
-        for item in raw_news[:20]:  # cap at 20 items
-            emb = item.get("embedding")
-            if emb and isinstance(emb, list):
-                news_embeddings.append(emb)
+        embs = [
+            emb for item in raw_news[:20]  # cap at 20 items
+            if isinstance(emb := item.get("embedding"), (list, np.ndarray)) and len(emb)
+        ] if raw_news else []
+        if embs:
+            dim = len(embs[0])
+            news_embeddings = np.asarray(
+                [emb for emb in embs if len(emb) == dim], dtype=np.float32
+            )
+        else:
+            news_embeddings = np.empty((0, self._embedding_dim), dtype=np.float32)
 
         # -- market regime --
-        regime = market_state.get("regime", {})
-        market_regime = {
-            "vix_level": _normalize_pct(regime.get("vix", 20.0) - 20.0, scale=30.0),
-            "trend_strength": _clip(regime.get("trend_strength", 0.0), -1.0, 1.0),
-            "breadth": _clip(regime.get("breadth", 0.5), 0.0, 1.0),
-            "volatility_regime": _clip(regime.get("volatility_regime", 0.0), -1.0, 1.0),
-            "momentum_regime": _clip(regime.get("momentum_regime", 0.0), -1.0, 1.0),
-            "risk_on": 1.0 if regime.get("risk_on", True) else 0.0,
-        }
+        market_regime = _encode_market_regime(market_state.get("regime", {}))
 
         # -- sector momentum --
         raw_sectors = market_state.get("sector_performance", {})
@@ -140,7 +223,7 @@ class StateEncoder:
                 "ticker": move.get("ticker", ""),
                 "change_pct_norm": _normalize_pct(move.get("change_pct", 0.0), scale=20.0),
                 "volume_ratio": _clip(move.get("volume_ratio", 1.0), 0.0, 10.0) / 10.0,
-                "has_news": 1.0 if move.get("has_news", False) else 0.0,
+                "has_news": float(bool(move.get("has_news", False))),
             })
 
         # -- trending topics --
@@ -166,9 +249,9 @@ class StateEncoder:
             "sector_momentum": sector_momentum,
             "unusual_moves": unusual_moves,
             "trending_topics": trending_topics,
-            "has_news": 1.0 if news_embeddings else 0.0,
-            "has_anomalies": 1.0 if unusual_moves else 0.0,
-            "has_social": 1.0 if trending_topics else 0.0,
+            "has_news": float(len(news_embeddings) > 0),
+            "has_anomalies": float(bool(unusual_moves)),
+            "has_social": float(bool(trending_topics)),
         }
 
     # ==================================================================
@@ -199,16 +282,23 @@ class StateEncoder:
             "risk_level_encoded": _encode_risk_level(idea.get("risk_level", "medium")),
             "timeframe_encoded": _encode_timeframe(idea.get("timeframe", "medium_term")),
             "num_tickers": _clip(len(idea.get("tickers", [])) / 5.0, 0.0, 1.0),
-            "has_thesis": 1.0 if idea.get("thesis") else 0.0,
+            "has_thesis": float(bool(idea.get("thesis"))),
             "source_encoded": _encode_idea_source(idea.get("source", "agent")),
         }
 
         # -- historical similar ideas --
         similar = idea.get("similar_historical_ideas", [])
         if similar:
-            win_rate = sum(1 for s in similar if s.get("profitable", False)) / len(similar)
-            avg_return = sum(s.get("return_pct", 0.0) for s in similar) / len(similar)
             count = len(similar)
+            wins = 0
+            total_return = 0.0
+            for s in similar:
+                get = s.get
+                if get("profitable", False):
+                    wins += 1
+                total_return += get("return_pct", 0.0)
+            win_rate = wins / count
+            avg_return = total_return / count
         else:
             win_rate = 0.5
             avg_return = 0.0
@@ -227,7 +317,7 @@ class StateEncoder:
             "max_drawdown_norm": _clip(bt.get("max_drawdown_pct", 0.0) / -50.0, -1.0, 0.0),
             "win_rate": _clip(bt.get("win_rate", 0.5), 0.0, 1.0),
             "profit_factor": _clip(bt.get("profit_factor", 1.0) / 3.0, 0.0, 1.0),
-            "available": 1.0 if bt else 0.0,
+            "available": float(bool(bt)),
         }
 
         # -- source score --
@@ -241,12 +331,7 @@ class StateEncoder:
         source_score = source_reliability.get(idea.get("source", "agent"), 0.5)
 
         # -- market context (compact) --
-        regime = market_state.get("regime", {})
-        market_context = {
-            "vix_level": _normalize_pct(regime.get("vix", 20.0) - 20.0, scale=30.0),
-            "trend_strength": _clip(regime.get("trend_strength", 0.0), -1.0, 1.0),
-            "risk_on": 1.0 if regime.get("risk_on", True) else 0.0,
-        }
+        market_context = _encode_market_regime(market_state.get("regime", {}), compact=True)
 
         return {
             "idea_features": idea_features,
@@ -279,19 +364,23 @@ class StateEncoder:
         - ``available_instruments``: list of instruments to trade.
         - ``liquidity_metrics``: bid-ask, volume, market-impact estimates.
         """
+        clip = _clip
+        norm_pct = _normalize_pct
+        max_positions = self._max_positions
+
         # -- idea params --
         idea_params = {
-            "expected_return_norm": _normalize_pct(
+            "expected_return_norm": norm_pct(
                 validated_idea.get("expected_return", 0.0), scale=50.0
             ),
-            "confidence": _clip(validated_idea.get("confidence_score", 0.5), 0.0, 1.0),
+            "confidence": clip(validated_idea.get("confidence_score", 0.5), 0.0, 1.0),
             "risk_level_encoded": _encode_risk_level(
                 validated_idea.get("risk_level", "medium")
             ),
             "timeframe_encoded": _encode_timeframe(
                 validated_idea.get("timeframe", "medium_term")
             ),
-            "suggested_direction": 1.0 if validated_idea.get("direction", "long") == "long" else -1.0,
+            "suggested_direction": 1.0 - 2.0 * (validated_idea.get("direction", "long") != "long"),
         }
 
         # -- portfolio exposure --
@@ -300,17 +389,15 @@ class StateEncoder:
         invested = portfolio_state.get("invested", 0.0)
         cash = portfolio_state.get("cash", 0.0)
 
-        sector_exposure: dict[str, float] = {}
-        for pos in positions:
-            sector = pos.get("asset_class", "unknown")
-            weight = pos.get("weight", 0.0)
-            sector_exposure[sector] = sector_exposure.get(sector, 0.0) + weight
+        sector_slots, sector_totals = _group_sector_weights(positions)
 
         portfolio_exposure = {
-            "invested_pct": _clip(invested / total_value, 0.0, 1.5),
-            "cash_pct": _clip(cash / total_value, 0.0, 1.0),
-            "num_positions_norm": _clip(len(positions) / self._max_positions, 0.0, 1.0),
-            "sector_exposure": {k: _clip(v, 0.0, 1.0) for k, v in sector_exposure.items()},
+            "invested_pct": clip(invested / total_value, 0.0, 1.5),
+            "cash_pct": clip(cash / total_value, 0.0, 1.0),
+            "num_positions_norm": clip(len(positions) / max_positions, 0.0, 1.0),
+            "sector_exposure": dict(
+                zip(sector_slots, np.clip(sector_totals, 0.0, 1.0).tolist())
+            ),
         }
 
         # -- correlation with existing --
@@ -324,9 +411,9 @@ class StateEncoder:
             max_corr = max(max_corr, abs(corr))
 
         correlation_with_existing = {
-            "ticker_overlap_norm": _clip(overlap_count / max(len(idea_tickers), 1), 0.0, 1.0),
-            "max_correlation": _clip(max_corr, 0.0, 1.0),
-            "avg_portfolio_correlation": _clip(
+            "ticker_overlap_norm": clip(overlap_count / max(len(idea_tickers), 1), 0.0, 1.0),
+            "max_correlation": clip(max_corr, 0.0, 1.0),
+            "avg_portfolio_correlation": clip(
                 portfolio_state.get("avg_correlation", 0.0), 0.0, 1.0
             ),
         }
@@ -338,8 +425,8 @@ class StateEncoder:
             available_instruments.append({
                 "symbol": inst.get("symbol", ""),
                 "type": inst.get("type", "equity"),
-                "liquidity_score": _clip(inst.get("liquidity_score", 0.5), 0.0, 1.0),
-                "spread_bps_norm": _clip(inst.get("spread_bps", 5.0) / 50.0, 0.0, 1.0),
+                "liquidity_score": clip(inst.get("liquidity_score", 0.5), 0.0, 1.0),
+                "spread_bps_norm": clip(inst.get("spread_bps", 5.0) / 50.0, 0.0, 1.0),
             })
 
         # -- liquidity metrics --
@@ -348,13 +435,13 @@ class StateEncoder:
         avg_volume = max(ticker_data.get("avg_volume", 1.0), 1.0)
 
         liquidity_metrics = {
-            "bid_ask_spread_bps_norm": _clip(
+            "bid_ask_spread_bps_norm": clip(
                 ticker_data.get("bid_ask_spread_bps", 5.0) / 50.0, 0.0, 1.0
             ),
-            "volume_ratio": _clip(
+            "volume_ratio": clip(
                 ticker_data.get("volume", avg_volume) / avg_volume, 0.0, 5.0
             ) / 5.0,
-            "market_impact_bps_norm": _clip(
+            "market_impact_bps_norm": clip(
                 ticker_data.get("estimated_impact_bps", 2.0) / 20.0, 0.0, 1.0
             ),
         }
@@ -388,80 +475,28 @@ class StateEncoder:
         - ``stop_distance``: normalised distance to stop and target.
         - ``market_regime``: compact regime features.
         """
-        entry_price = max(trade.get("entry_price", 1.0), 0.01)
-        current_price = trade.get("current_price", entry_price)
-        stop_loss = trade.get("stop_loss", 0.0)
-        take_profit = trade.get("take_profit", 0.0)
-        direction = trade.get("direction", "long")
-
-        # P&L calculation
-        if direction == "long":
-            pnl_pct = (current_price - entry_price) / entry_price * 100.0
-        else:
-            pnl_pct = (entry_price - current_price) / entry_price * 100.0
-
-        trade_pnl = {
-            "pnl_pct_norm": _normalize_pct(pnl_pct, scale=20.0),
-            "pnl_dollar_norm": _normalize_pct(trade.get("pnl", 0.0), scale=10000.0),
-            "unrealised_pnl_pct": _normalize_pct(pnl_pct, scale=20.0),
-            "max_favorable_excursion_norm": _normalize_pct(
-                trade.get("max_favorable_excursion_pct", 0.0), scale=20.0
-            ),
-            "max_adverse_excursion_norm": _normalize_pct(
-                trade.get("max_adverse_excursion_pct", 0.0), scale=20.0
-            ),
-        }
-
-        # Time elapsed
-        total_expected_seconds = max(trade.get("expected_duration_seconds", 86400.0), 1.0)
-        elapsed_seconds = trade.get("elapsed_seconds", 0.0)
-        time_elapsed = {
-            "fraction_of_expected": _clip(elapsed_seconds / total_expected_seconds, 0.0, 3.0) / 3.0,
-            "hours_norm": _clip(elapsed_seconds / 3600.0 / 168.0, 0.0, 1.0),  # cap at 1 week
-            "is_overdue": 1.0 if elapsed_seconds > total_expected_seconds else 0.0,
-        }
-
-        # Thesis signals
-        signals = trade.get("thesis_signals", {})
-        thesis_signals = {
-            "thesis_intact": 1.0 if signals.get("intact", True) else 0.0,
-            "catalyst_occurred": 1.0 if signals.get("catalyst_occurred", False) else 0.0,
-            "sentiment_shift": _clip(signals.get("sentiment_shift", 0.0), -1.0, 1.0),
-            "fundamental_change": 1.0 if signals.get("fundamental_change", False) else 0.0,
-        }
-
-        # Stop distance
-        if direction == "long":
-            stop_dist = (current_price - stop_loss) / entry_price * 100.0 if stop_loss > 0 else 0.0
-            target_dist = (take_profit - current_price) / entry_price * 100.0 if take_profit > 0 else 0.0
-        else:
-            stop_dist = (stop_loss - current_price) / entry_price * 100.0 if stop_loss > 0 else 0.0
-            target_dist = (current_price - take_profit) / entry_price * 100.0 if take_profit > 0 else 0.0
-
-        stop_distance = {
-            "stop_distance_pct_norm": _normalize_pct(stop_dist, scale=10.0),
-            "target_distance_pct_norm": _normalize_pct(target_dist, scale=10.0),
-            "risk_reward_ratio": _clip(
-                _safe_div(target_dist, abs(stop_dist) if stop_dist else 1.0), 0.0, 5.0
-            ) / 5.0,
-            "stop_breached": 1.0 if stop_dist < 0 else 0.0,
-        }
-
-        # Market regime (compact)
-        regime = market_state.get("regime", {})
-        market_regime = {
-            "vix_level": _normalize_pct(regime.get("vix", 20.0) - 20.0, scale=30.0),
-            "trend_strength": _clip(regime.get("trend_strength", 0.0), -1.0, 1.0),
-            "risk_on": 1.0 if regime.get("risk_on", True) else 0.0,
-        }
+        obs: dict[str, Any] = {}
+        for (group, key), value in zip(
+            TRADE_MONITOR_FEATURES, _trade_monitor_features(trade, market_state)
+        ):
+            obs.setdefault(group, {})[key] = value
+        return obs
+
+    def encode_trade_monitor_vector(
+        self,
+        trade: dict[str, Any],
+        market_state: dict[str, Any],
+    ) -> np.ndarray:
+        """Encode the **trade-monitor** observation as a flat float32 vector.
 
-        return {
-            "trade_pnl": trade_pnl,
-            "time_elapsed": time_elapsed,
-            "thesis_signals": thesis_signals,
-            "stop_distance": stop_distance,
-            "market_regime": market_regime,
-        }
+        Same features as :meth:`encode_trade_monitor_state`, laid out in
+        :data:`TRADE_MONITOR_FEATURES` order, for policies trained
+        against the fixed schema.  The features are written into a
+        preallocated buffer and a copy is returned.
+        """
+        buf = self._out_buf
+        buf[:] = _trade_monitor_features(trade, market_state)
+        return buf.copy()
 
     # ==================================================================
     # 5.  Portfolio Constructor / Risk Manager shared
@@ -486,75 +521,85 @@ class StateEncoder:
         - ``market_outlook``: forward-looking regime indicators.
         - ``drift_from_target``: deviation of current weights from targets.
         """
+        clip = _clip
+        norm_pct = _normalize_pct
+        max_positions = self._max_positions
+
         total_value = max(portfolio.get("total_value", 1.0), 1.0)
         positions = portfolio.get("positions", [])
 
         # -- allocation --
-        sector_alloc: dict[str, float] = {}
-        for pos in positions:
-            sector = pos.get("asset_class", "unknown")
-            weight = pos.get("weight", 0.0)
-            sector_alloc[sector] = sector_alloc.get(sector, 0.0) + weight
+        if positions:
+            sector_slots, sector_totals = _group_sector_weights(positions)
+            sector_weights = dict(zip(sector_slots, np.clip(sector_totals, 0.0, 1.0).tolist()))
+            max_sector_weight = float(sector_totals.max())
+            top_position_weight = max(pos.get("weight", 0.0) for pos in positions)
+        else:
+            sector_slots, sector_totals = {}, np.zeros(0)
+            sector_weights = {}
+            max_sector_weight = top_position_weight = 0.0
 
         allocation = {
-            "cash_weight": _clip(portfolio.get("cash", 0.0) / total_value, 0.0, 1.0),
-            "invested_weight": _clip(portfolio.get("invested", 0.0) / total_value, 0.0, 1.5),
-            "num_positions_norm": _clip(len(positions) / self._max_positions, 0.0, 1.0),
-            "sector_weights": {k: _clip(v, 0.0, 1.0) for k, v in sector_alloc.items()},
-            "top_position_weight": max((pos.get("weight", 0.0) for pos in positions), default=0.0),
+            "cash_weight": clip(portfolio.get("cash", 0.0) / total_value, 0.0, 1.0),
+            "invested_weight": clip(portfolio.get("invested", 0.0) / total_value, 0.0, 1.5),
+            "num_positions_norm": clip(len(positions) / max_positions, 0.0, 1.0),
+            "sector_weights": sector_weights,
+            "top_position_weight": top_position_weight,
         }
 
         # -- risk metrics --
         risk = portfolio.get("risk_metrics", {})
         risk_metrics = {
-            "portfolio_var_norm": _normalize_pct(risk.get("var_95_pct", 2.0), scale=10.0),
-            "portfolio_cvar_norm": _normalize_pct(risk.get("cvar_95_pct", 3.0), scale=15.0),
-            "beta_norm": _clip(risk.get("beta", 1.0) / 2.0, -1.0, 1.0),
-            "max_sector_exposure_norm": _clip(
-                max(sector_alloc.values(), default=0.0) / 0.4, 0.0, 1.0
-            ),
-            "leverage": _clip(risk.get("leverage", 1.0) / 3.0, 0.0, 1.0),
-            "correlation_avg": _clip(risk.get("avg_correlation", 0.3), 0.0, 1.0),
+            "portfolio_var_norm": norm_pct(risk.get("var_95_pct", 2.0), scale=10.0),
+            "portfolio_cvar_norm": norm_pct(risk.get("cvar_95_pct", 3.0), scale=15.0),
+            "beta_norm": clip(risk.get("beta", 1.0) / 2.0, -1.0, 1.0),
+            "max_sector_exposure_norm": clip(max_sector_weight / 0.4, 0.0, 1.0),
+            "leverage": clip(risk.get("leverage", 1.0) / 3.0, 0.0, 1.0),
+            "correlation_avg": clip(risk.get("avg_correlation", 0.3), 0.0, 1.0),
         }
 
         # -- performance --
         perf = portfolio.get("performance", {})
         performance = {
-            "return_1d_norm": _normalize_pct(perf.get("return_1d_pct", 0.0), scale=5.0),
-            "return_1w_norm": _normalize_pct(perf.get("return_1w_pct", 0.0), scale=10.0),
-            "return_1m_norm": _normalize_pct(perf.get("return_1m_pct", 0.0), scale=20.0),
-            "sharpe_norm": _clip(perf.get("sharpe", 0.0) / 3.0, -1.0, 1.0),
-            "drawdown_norm": _clip(perf.get("current_drawdown_pct", 0.0) / -30.0, -1.0, 0.0),
-            "pnl_total_norm": _normalize_pct(portfolio.get("pnl_pct", 0.0), scale=50.0),
+            "return_1d_norm": norm_pct(perf.get("return_1d_pct", 0.0), scale=5.0),
+            "return_1w_norm": norm_pct(perf.get("return_1w_pct", 0.0), scale=10.0),
+            "return_1m_norm": norm_pct(perf.get("return_1m_pct", 0.0), scale=20.0),
+            "sharpe_norm": clip(perf.get("sharpe", 0.0) / 3.0, -1.0, 1.0),
+            "drawdown_norm": clip(perf.get("current_drawdown_pct", 0.0) / -30.0, -1.0, 0.0),
+            "pnl_total_norm": norm_pct(portfolio.get("pnl_pct", 0.0), scale=50.0),
         }
 
         # -- market outlook --
-        regime = market_state.get("regime", {})
         outlook = market_state.get("outlook", {})
         market_outlook = {
-            "vix_level": _normalize_pct(regime.get("vix", 20.0) - 20.0, scale=30.0),
-            "trend_strength": _clip(regime.get("trend_strength", 0.0), -1.0, 1.0),
-            "risk_on": 1.0 if regime.get("risk_on", True) else 0.0,
-            "recession_prob": _clip(outlook.get("recession_probability", 0.1), 0.0, 1.0),
-            "rate_direction": _clip(outlook.get("rate_direction", 0.0), -1.0, 1.0),
+            **_encode_market_regime(market_state.get("regime", {}), compact=True),
+            "recession_prob": clip(outlook.get("recession_probability", 0.1), 0.0, 1.0),
+            "rate_direction": clip(outlook.get("rate_direction", 0.0), -1.0, 1.0),
         }
 
         # -- drift from target --
         target_alloc = portfolio.get("target_allocation", {})
-        drift: dict[str, float] = {}
-        for sector, target_weight in target_alloc.items():
-            current_weight = sector_alloc.get(sector, 0.0)
-            drift[sector] = _clip(current_weight - target_weight, -0.5, 0.5)
-
-        drift_from_target = {
-            "sector_drift": drift,
-            "total_drift_abs": _clip(
-                sum(abs(v) for v in drift.values()), 0.0, 2.0
-            ) / 2.0,
-            "max_drift": _clip(
-                max((abs(v) for v in drift.values()), default=0.0), 0.0, 0.5
-            ) / 0.5,
-        }
+        if target_alloc:
+            n_targets = len(target_alloc)
+            current_for_target = np.fromiter(
+                (
+                    sector_totals[sector_slots[sector]] if sector in sector_slots else 0.0
+                    for sector in target_alloc
+                ),
+                dtype=float,
+                count=n_targets,
+            )
+            target_weights = np.fromiter(target_alloc.values(), dtype=float, count=n_targets)
+            drift_arr = np.clip(current_for_target - target_weights, -0.5, 0.5)
+            abs_drift = np.abs(drift_arr)
+
+            drift_from_target = {
+                "sector_drift": dict(zip(target_alloc, drift_arr.tolist())),
+                "total_drift_abs": clip(float(abs_drift.sum()), 0.0, 2.0) / 2.0,
+                "max_drift": clip(float(abs_drift.max()), 0.0, 0.5) / 0.5,
+            }
+        else:
+            drift_from_target = {"sector_drift": {}, "total_drift_abs": 0.0, "max_drift": 0.0}
 
         return {
             "allocation": allocation,
@@ -565,6 +610,96 @@ class StateEncoder:
         }
 
 
+# ---------------------------------------------------------------------------
+# Trade-monitor feature kernel
+# ---------------------------------------------------------------------------
+
+TRADE_MONITOR_FEATURES: tuple[tuple[str, str], ...] = (
+    ("trade_pnl", "pnl_pct_norm"),
+    ("trade_pnl", "pnl_dollar_norm"),
+    ("trade_pnl", "unrealised_pnl_pct"),
+    ("trade_pnl", "max_favorable_excursion_norm"),
+    ("trade_pnl", "max_adverse_excursion_norm"),
+    ("time_elapsed", "fraction_of_expected"),
+    ("time_elapsed", "hours_norm"),
+    ("time_elapsed", "is_overdue"),
+    ("thesis_signals", "thesis_intact"),
+    ("thesis_signals", "catalyst_occurred"),
+    ("thesis_signals", "sentiment_shift"),
+    ("thesis_signals", "fundamental_change"),
+    ("stop_distance", "stop_distance_pct_norm"),
+    ("stop_distance", "target_distance_pct_norm"),
+    ("stop_distance", "risk_reward_ratio"),
+    ("stop_distance", "stop_breached"),
+    ("market_regime", "vix_level"),
+    ("market_regime", "trend_strength"),
+    ("market_regime", "risk_on"),
+)
+
+
+def _trade_monitor_features(
+    trade: dict[str, Any],
+    market_state: dict[str, Any],
+) -> tuple[float, ...]:
+    """Compute the trade-monitor features in :data:`TRADE_MONITOR_FEATURES` order.
+
+    The schema is fixed, so the normalisation arithmetic is written out
+    inline with its constants rather than routed through the
+    ``_clip`` / ``_normalize_pct`` helpers.
+    """
+    get = trade.get
+    entry_price = max(get("entry_price", 1.0), 0.01)
+    current_price = get("current_price", entry_price)
+    stop_loss = get("stop_loss", 0.0)
+    take_profit = get("take_profit", 0.0)
+    sign = 1.0 - 2.0 * (get("direction", "long") != "long")
+
+    # P&L
+    pnl_pct = sign * (current_price - entry_price) / entry_price * 100.0
+    pnl_norm = max(-1.0, min(1.0, pnl_pct / 20.0))
+
+    # Time elapsed
+    total_expected_seconds = max(get("expected_duration_seconds", 86400.0), 1.0)
+    elapsed_seconds = get("elapsed_seconds", 0.0)
+
+    # Thesis signals
+    signals = get("thesis_signals", {})
+
+    # Stop distance (percent of entry price, positive = room left)
+    stop_dist = (
+        sign * (current_price - stop_loss) / entry_price * 100.0 if stop_loss > 0 else 0.0
+    )
+    target_dist = (
+        sign * (take_profit - current_price) / entry_price * 100.0 if take_profit > 0 else 0.0
+    )
+    # A zero stop distance falls back to a unit denominator.
+    risk_reward = target_dist / (abs(stop_dist) or 1.0)
+
+    vix, trend, _, _, _, risk_on = _extract_regime(market_state.get("regime", {}))
+
+    return (
+        pnl_norm,
+        max(-1.0, min(1.0, get("pnl", 0.0) / 10000.0)),
+        pnl_norm,
+        max(-1.0, min(1.0, get("max_favorable_excursion_pct", 0.0) / 20.0)),
+        max(-1.0, min(1.0, get("max_adverse_excursion_pct", 0.0) / 20.0)),
+        max(0.0, min(3.0, elapsed_seconds / total_expected_seconds)) / 3.0,
+        max(0.0, min(1.0, elapsed_seconds / 3600.0 / 168.0)),  # cap at 1 week
+        float(elapsed_seconds > total_expected_seconds),
+        float(bool(signals.get("intact", True))),
+        float(bool(signals.get("catalyst_occurred", False))),
+        max(-1.0, min(1.0, signals.get("sentiment_shift", 0.0))),
+        float(bool(signals.get("fundamental_change", False))),
+        max(-1.0, min(1.0, stop_dist / 10.0)),
+        max(-1.0, min(1.0, target_dist / 10.0)),
+        max(0.0, min(5.0, risk_reward)) / 5.0,
+        float(stop_dist < 0),
+        max(-1.0, min(1.0, (vix - 20.0) / 30.0)),
+        max(-1.0, min(1.0, trend)),
+        float(bool(risk_on)),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Categorical encoding helpers
 # ---------------------------------------------------------------------------
@@ -4,16 +4,36 @@ Manages training loops, experience collection, and agent improvement
 based on reinforcement learning from investment outcomes.
 """
 
+import heapq
+import time
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import numpy as np
+
 from src.rl.replay_buffer import Experience, ReplayBuffer
 
 
-@dataclass
+class _LazyInsight:
+    """An insight message formatted only when converted to ``str``."""
+
+    __slots__ = ("fmt", "args")
+
+    def __init__(self, fmt: str, *args: Any) -> None:
+        self.fmt = fmt
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.fmt.format(*self.args)
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+@dataclass(slots=True)
 class TrainResult:
     """Result of a training step."""
 
@@ -21,11 +41,11 @@ class TrainResult:
     batch_size: int
     avg_reward: float
     reward_std: float
-    insights: list[str] = field(default_factory=list)
+    insights: list[str | _LazyInsight] = field(default_factory=list)
     updated_parameters: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeSummary:
     """Summary of a completed episode."""
 
@@ -34,8 +54,53 @@ class EpisodeSummary:
     total_reward: float
     total_steps: int
     outcome: dict[str, Any]
-    started_at: datetime
-    ended_at: datetime | None = None
+    started_at: float = field(default_factory=time.time)  # Unix epoch seconds
+    ended_at: float | None = None
+
+
+@dataclass(slots=True)
+class RunningRewardStats:
+    """Streaming reward mean and variance using Welford's algorithm."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, reward: float) -> None:
+        """Fold one reward into the running statistics."""
+        self.count += 1
+        delta = reward - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (reward - self.mean)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the rewards seen so far."""
+        return (self.m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+def _action_type_ids(batch: list[Experience]) -> tuple[list[str], np.ndarray]:
+    """Map each experience's action type to a dense integer id.
+
+    Returns ``(names, ids)`` where ``names[ids[i]]`` is the action type
+    of ``batch[i]``.  Ids are assigned in first-seen order.
+    """
+    index: dict[str, int] = {}
+    ids = np.fromiter(
+        (index.setdefault(e.action_type, len(index)) for e in batch),
+        dtype=np.int32,
+        count=len(batch),
+    )
+    return list(index), ids
+
+
+def _group_rewards(
+    ids: np.ndarray, rewards: np.ndarray, n_types: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-action-type reward sums and counts for parallel *ids* / *rewards*."""
+    sums = np.bincount(ids, weights=rewards, minlength=n_types)
+    counts = np.bincount(ids, minlength=n_types)
+    return sums, counts
 
 
 class RLTrainer:
@@ -51,11 +116,19 @@ class RLTrainer:
     Future versions will implement actual policy gradient or Q-learning.
     """
 
-    def __init__(self, replay_buffer: ReplayBuffer | None = None):
+    def __init__(self, replay_buffer: ReplayBuffer | None = None, history_cap: int = 1000):
         self.replay_buffer = replay_buffer or ReplayBuffer()
         self._train_counts: dict[str, int] = defaultdict(int)
-        self._last_train_time: dict[str, datetime] = {}
-        self._training_history: dict[str, list[TrainResult]] = defaultdict(list)
+        self._last_train_time: dict[str, float] = {}  # Unix epoch seconds
+        self._history_cap = history_cap
+        self._training_history: dict[str, deque[TrainResult]] = defaultdict(
+            lambda: deque(maxlen=self._history_cap)
+        )
+        self._reward_trend: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=20))
+        self._episode_steps: dict[str, int] = {}
+        self._reward_stats: dict[str, RunningRewardStats] = defaultdict(RunningRewardStats)
+        # agent -> ((train count, buffer size), stats) for get_training_stats
+        self._stats_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
         self._min_experiences_to_train = 100
         self._train_interval_seconds = 300  # 5 minutes between training steps
         self._running = False
@@ -81,37 +154,33 @@ class RLTrainer:
             reward=reward,
             next_state=next_state,
             done=done,
-            metadata=metadata or {},
-            timestamp=datetime.utcnow(),
+            metadata=metadata or None,
+            timestamp=time.time(),
         )
         self.replay_buffer.add(experience)
+        self._reward_stats[agent_name].update(reward)
 
     def _get_next_step(self, episode_id: str) -> int:
         """Get the next step number for an episode."""
         if not episode_id:
             return 0
-        existing = [
-            e.step
-            for e in self.replay_buffer._buffer
-            if e.episode_id == episode_id
-        ]
-        return max(existing, default=-1) + 1
+        step = self._episode_steps.get(episode_id, -1) + 1
+        self._episode_steps[episode_id] = step
+        return step
+
+    def reset_episode(self, episode_id: str) -> None:
+        """Forget the step counter for a finished episode."""
+        self._episode_steps.pop(episode_id, None)
 
     def should_train(self, agent_name: str) -> bool:
         """Check if enough experiences have been collected to warrant training."""
-        agent_experiences = self.replay_buffer.get_agent_experiences(
-            agent_name, limit=self._min_experiences_to_train
-        )
-        if len(agent_experiences) < self._min_experiences_to_train:
-            return False
-
+        # The interval check rejects most polls, so run it first.
         last_train = self._last_train_time.get(agent_name)
-        if last_train:
-            elapsed = (datetime.utcnow() - last_train).total_seconds()
-            if elapsed < self._train_interval_seconds:
+        if last_train is not None:
+            if time.time() - last_train < self._train_interval_seconds:
                 return False
 
-        return True
+        return self.replay_buffer.agent_count(agent_name) >= self._min_experiences_to_train
 
     def train_step(self, agent_name: str, batch_size: int = 64) -> TrainResult:
         """
@@ -120,11 +189,7 @@ class RLTrainer:
         Current implementation: analyze experience batch and generate insights.
         Future: actual gradient-based policy updates.
         """
-        batch = self.replay_buffer.sample(min(batch_size, self.replay_buffer.size()))
-
-        agent_batch = [e for e in batch if e.agent_name == agent_name]
-        if not agent_batch:
-            agent_batch = self.replay_buffer.get_agent_experiences(agent_name, limit=batch_size)
+        agent_batch = self.replay_buffer.sample_agent(agent_name, batch_size)
 
         if not agent_batch:
             return TrainResult(
@@ -135,12 +200,20 @@ class RLTrainer:
                 insights=["No experiences available for training"],
             )
 
-        rewards = [e.reward for e in agent_batch]
-        avg_reward = sum(rewards) / len(rewards)
-        reward_std = (sum((r - avg_reward) ** 2 for r in rewards) / len(rewards)) ** 0.5
+        rewards = np.fromiter(
+            (e.reward for e in agent_batch), dtype=np.float64, count=len(agent_batch)
+        )
+        avg_reward = float(rewards.mean())
+        reward_std = float(rewards.std())
+
+        type_names, type_ids = _action_type_ids(agent_batch)
 
-        insights = self._generate_insights(agent_name, agent_batch, avg_reward, reward_std)
-        updated_params = self._suggest_parameter_updates(agent_name, agent_batch, avg_reward)
+        insights = self._generate_insights(
+            agent_name, agent_batch, rewards, type_names, type_ids, avg_reward, reward_std
+        )
+        updated_params = self._suggest_parameter_updates(
+            agent_name, agent_batch, rewards, type_names, type_ids, avg_reward
+        )
 
         result = TrainResult(
             agent_name=agent_name,
@@ -152,8 +225,9 @@ class RLTrainer:
         )
 
         self._train_counts[agent_name] += 1
-        self._last_train_time[agent_name] = datetime.utcnow()
+        self._last_train_time[agent_name] = time.time()
         self._training_history[agent_name].append(result)
+        self._reward_trend[agent_name].append(avg_reward)
 
         return result
 
@@ -161,49 +235,65 @@ class RLTrainer:
         self,
         agent_name: str,
         batch: list[Experience],
+        rewards: np.ndarray,
+        type_names: list[str],
+        type_ids: np.ndarray,
         avg_reward: float,
         reward_std: float,
-    ) -> list[str]:
-        """Generate human-readable insights from experience batch."""
-        insights = []
-
-        positive = [e for e in batch if e.reward > 0]
-        negative = [e for e in batch if e.reward < 0]
-        win_rate = len(positive) / len(batch) if batch else 0
-
-        insights.append(
-            f"Win rate: {win_rate:.1%} ({len(positive)}/{len(batch)} positive outcomes)"
-        )
-        insights.append(f"Avg reward: {avg_reward:.3f} (std: {reward_std:.3f})")
-
-        if positive:
-            best = max(positive, key=lambda e: e.reward)
-            insights.append(
-                f"Best action: {best.action.get('type', 'unknown')} "
-                f"with reward {best.reward:.3f}"
-            )
+    ) -> list[_LazyInsight]:
+        """Generate human-readable insights from experience batch.
 
-            pos_actions = defaultdict(list)
-            for e in positive:
-                pos_actions[e.action.get("type", "unknown")].append(e.reward)
-            best_action_type = max(pos_actions, key=lambda k: sum(pos_actions[k]) / len(pos_actions[k]))
-            insights.append(
-                f"Most profitable action type: '{best_action_type}' "
-                f"(avg reward: {sum(pos_actions[best_action_type]) / len(pos_actions[best_action_type]):.3f})"
-            )
+        *rewards* and *type_ids* are parallel to *batch*, as built once
+        in :meth:`train_step` (see :func:`_action_type_ids`).  Messages
+        are only formatted when a caller converts them with ``str``.
+        """
+        insights = []
 
-        if negative:
-            worst = min(negative, key=lambda e: e.reward)
-            insights.append(
-                f"Worst action: {worst.action.get('type', 'unknown')} "
-                f"with reward {worst.reward:.3f}"
+        pos_mask = rewards > 0
+        n_positive = int(pos_mask.sum())
+        n_negative = int((rewards < 0).sum())
+        win_rate = n_positive / len(batch) if batch else 0
+
+        insights.append(_LazyInsight(
+            "Win rate: {:.1%} ({}/{} positive outcomes)", win_rate, n_positive, len(batch)
+        ))
+        insights.append(_LazyInsight("Avg reward: {:.3f} (std: {:.3f})", avg_reward, reward_std))
+
+        if n_positive:
+            best = batch[int(rewards.argmax())]
+            insights.append(_LazyInsight(
+                "Best action: {} with reward {:.3f}",
+                best.action_type,
+                best.reward,
+            ))
+
+            pos_sums, pos_counts = _group_rewards(
+                type_ids[pos_mask], rewards[pos_mask], len(type_names)
             )
+            pos_means = np.full(len(type_names), -np.inf)
+            np.divide(pos_sums, pos_counts, out=pos_means, where=pos_counts > 0)
+            best_type = int(pos_means.argmax())
+            insights.append(_LazyInsight(
+                "Most profitable action type: '{}' (avg reward: {:.3f})",
+                type_names[best_type],
+                float(pos_means[best_type]),
+            ))
+
+        if n_negative:
+            worst = batch[int(rewards.argmin())]
+            insights.append(_LazyInsight(
+                "Worst action: {} with reward {:.3f}",
+                worst.action_type,
+                worst.reward,
+            ))
 
         if len(batch) >= 10:
-            recent = sorted(batch, key=lambda e: e.timestamp)[-10:]
-            recent_avg = sum(e.reward for e in recent) / len(recent)
+            recent = heapq.nlargest(10, range(len(batch)), key=lambda i: batch[i].timestamp)
+            recent_avg = float(rewards[recent].mean())
             trend = "improving" if recent_avg > avg_reward else "declining"
-            insights.append(f"Recent performance trend: {trend} (recent avg: {recent_avg:.3f})")
+            insights.append(_LazyInsight(
+                "Recent performance trend: {} (recent avg: {:.3f})", trend, recent_avg
+            ))
 
         return insights
 
@@ -211,27 +301,34 @@ class RLTrainer:
         self,
         agent_name: str,
         batch: list[Experience],
+        rewards: np.ndarray,
+        type_names: list[str],
+        type_ids: np.ndarray,
         avg_reward: float,
     ) -> dict[str, Any]:
         """Suggest parameter adjustments based on experience patterns."""
         updates: dict[str, Any] = {}
 
-        action_rewards: dict[str, list[float]] = defaultdict(list)
-        for e in batch:
-            action_type = e.action.get("type", "unknown")
-            action_rewards[action_type].append(e.reward)
+        type_sums, type_counts = _group_rewards(type_ids, rewards, len(type_names))
+        type_means = type_sums / type_counts
+        preference_weights = np.clip(1.0 + type_means, 0.1, 2.0)
 
-        action_preferences = {}
-        for action_type, rewards in action_rewards.items():
-            action_avg = sum(rewards) / len(rewards)
-            action_preferences[action_type] = {
+        action_preferences = {
+            action_type: {
                 "avg_reward": round(action_avg, 4),
-                "count": len(rewards),
-                "preference_weight": round(max(0.1, min(2.0, 1.0 + action_avg)), 4),
+                "count": count,
+                "preference_weight": round(weight, 4),
             }
+            for action_type, action_avg, count, weight in zip(
+                type_names,
+                type_means.tolist(),
+                type_counts.tolist(),
+                preference_weights.tolist(),
+            )
+        }
         updates["action_preferences"] = action_preferences
 
-        win_rate = sum(1 for e in batch if e.reward > 0) / len(batch) if batch else 0
+        win_rate = int((rewards > 0).sum()) / len(batch) if batch else 0
         if win_rate < 0.3:
             updates["suggested_adjustments"] = [
                 "Consider more conservative approach",
@@ -251,8 +348,12 @@ class RLTrainer:
         return updates
 
     def get_training_stats(self, agent_name: str) -> dict[str, Any]:
-        """Get aggregated training statistics for an agent."""
-        history = self._training_history.get(agent_name, [])
+        """Get aggregated training statistics for an agent.
+
+        The result is cached per agent and reused until the agent trains
+        again or the replay buffer size changes; callers get their own copy.
+        """
+        history = self._training_history.get(agent_name)
 
         if not history:
             return {
@@ -261,32 +362,65 @@ class RLTrainer:
                 "status": "untrained",
             }
 
-        return {
+        token = (self._train_counts[agent_name], self.replay_buffer.size())
+        cached = self._stats_cache.get(agent_name)
+        if cached is not None and cached[0] == token:
+            return self._copy_stats(cached[1])
+
+        stats = {
             "agent_name": agent_name,
-            "total_train_steps": len(history),
+            "total_train_steps": self._train_counts[agent_name],
             "latest_avg_reward": history[-1].avg_reward,
             "latest_reward_std": history[-1].reward_std,
-            "reward_trend": [r.avg_reward for r in history[-20:]],
-            "latest_insights": history[-1].insights,
+            "reward_trend": list(self._reward_trend[agent_name]),
+            "latest_insights": [str(insight) for insight in history[-1].insights],
             "total_experiences": self.replay_buffer.size(),
-            "last_trained": self._last_train_time.get(agent_name, "never"),
+            "last_trained": (
+                datetime.fromtimestamp(self._last_train_time[agent_name], tz=timezone.utc)
+                if agent_name in self._last_train_time
+                else "never"
+            ),
+        }
+        self._stats_cache[agent_name] = (token, stats)
+        return self._copy_stats(stats)
+
+    @staticmethod
+    def _copy_stats(stats: dict[str, Any]) -> dict[str, Any]:
+        # The cached dict must not be mutated through a returned reference.
+        return {
+            **stats,
+            "reward_trend": list(stats["reward_trend"]),
+            "latest_insights": list(stats["latest_insights"]),
+        }
+
+    def get_reward_baseline(self, agent_name: str) -> dict[str, Any]:
+        """Get the running reward mean/std over every experience recorded for an agent.
+
+        Updated in O(1) per :meth:`record_experience`, so it is a cheap
+        baseline to compare a training batch's ``avg_reward`` against.
+        """
+        stats = self._reward_stats.get(agent_name) or RunningRewardStats()
+        return {
+            "agent_name": agent_name,
+            "count": stats.count,
+            "avg_reward": stats.mean,
+            "reward_std": stats.std,
         }
 
     def get_all_training_stats(self) -> list[dict[str, Any]]:
         """Get training stats for all agents that have been trained."""
-        agents = set(self._train_counts.keys())
-        agent_experiences = set(e.agent_name for e in self.replay_buffer._buffer)
-        all_agents = agents | agent_experiences
+        all_agents = self._train_counts.keys() | self.replay_buffer.agent_names()
         return [self.get_training_stats(name) for name in sorted(all_agents)]
 
     def update_agent_from_experience(
-        self, agent_name: str, insights: list[str]
+        self, agent_name: str, insights: list[str | _LazyInsight]
     ) -> dict[str, Any]:
         """
         Return updated parameters/prompt adjustments based on learned patterns.
         In the future this would directly modify agent behavior.
         """
         stats = self.get_training_stats(agent_name)
+        insights = [str(insight) for insight in insights]
 
         return {
             "agent_name": agent_name,
@@ -303,108 +437,162 @@ class RLTrainer:
 
 
 class EpisodeManager:
-    """Manages RL episodes for tracking agent performance over time."""
+    """Manages RL episodes for tracking agent performance over time.
+
+    Episode fields are stored column-wise: rewards, step counts and
+    start/end times live in parallel numpy arrays indexed by row, so
+    per-agent statistics are computed with vector reductions.  Rows
+    whose episode has not ended hold ``NaN`` in the end-time column.
+    """
 
-    def __init__(self):
-        self._episodes: dict[str, EpisodeSummary] = {}
-        self._agent_episodes: dict[str, list[str]] = defaultdict(list)
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self, trainer: RLTrainer | None = None):
+        self._trainer = trainer
+        self._size = 0
+        self._rewards = np.zeros(self._INITIAL_CAPACITY)
+        self._steps = np.zeros(self._INITIAL_CAPACITY, dtype=np.int64)
+        self._started_at = np.zeros(self._INITIAL_CAPACITY)
+        self._ended_at = np.full(self._INITIAL_CAPACITY, np.nan)
+        self._episode_ids: list[str] = []
+        self._agent_names: list[str] = []
+        self._outcomes: list[dict[str, Any]] = []
+        self._rows: dict[str, int] = {}
+        self._agent_rows: dict[str, list[int]] = defaultdict(list)
+
+    def _grow(self) -> None:
+        """Double the capacity of the column arrays."""
+        capacity = len(self._rewards) * 2
+        self._rewards = np.resize(self._rewards, capacity)
+        self._steps = np.resize(self._steps, capacity)
+        self._started_at = np.resize(self._started_at, capacity)
+        ended_at = np.full(capacity, np.nan)
+        ended_at[: self._size] = self._ended_at[: self._size]
+        self._ended_at = ended_at
+
+    def _summary(self, row: int) -> EpisodeSummary:
+        """Materialise the :class:`EpisodeSummary` stored at *row*."""
+        ended_at = self._ended_at[row]
+        return EpisodeSummary(
+            episode_id=self._episode_ids[row],
+            agent_name=self._agent_names[row],
+            total_reward=float(self._rewards[row]),
+            total_steps=int(self._steps[row]),
+            outcome=self._outcomes[row],
+            started_at=float(self._started_at[row]),
+            ended_at=None if np.isnan(ended_at) else float(ended_at),
+        )
 
     def start_episode(self, agent_name: str) -> str:
         """Start a new episode and return the episode ID."""
         episode_id = str(uuid.uuid4())
-        summary = EpisodeSummary(
-            episode_id=episode_id,
-            agent_name=agent_name,
-            total_reward=0.0,
-            total_steps=0,
-            outcome={},
-            started_at=datetime.utcnow(),
-        )
-        self._episodes[episode_id] = summary
-        self._agent_episodes[agent_name].append(episode_id)
+        row = self._size
+        if row == len(self._rewards):
+            self._grow()
+        self._rewards[row] = 0.0
+        self._steps[row] = 0
+        self._started_at[row] = time.time()
+        self._episode_ids.append(episode_id)
+        self._agent_names.append(agent_name)
+        self._outcomes.append({})
+        self._rows[episode_id] = row
+        self._agent_rows[agent_name].append(row)
+        self._size += 1
         return episode_id
 
     def record_step(self, episode_id: str, reward: float) -> None:
         """Record a step within an episode."""
-        if episode_id in self._episodes:
-            self._episodes[episode_id].total_reward += reward
-            self._episodes[episode_id].total_steps += 1
+        row = self._rows.get(episode_id)
+        if row is not None:
+            self._rewards[row] += reward
+            self._steps[row] += 1
 
     def end_episode(self, episode_id: str, outcome: dict[str, Any]) -> EpisodeSummary | None:
         """End an episode and save the outcome."""
-        if episode_id not in self._episodes:
+        row = self._rows.get(episode_id)
+        if row is None:
             return None
 
-        summary = self._episodes[episode_id]
-        summary.ended_at = datetime.utcnow()
-        summary.outcome = outcome
-        return summary
+        self._ended_at[row] = time.time()
+        self._outcomes[row] = outcome
+        if self._trainer is not None:
+            self._trainer.reset_episode(episode_id)
+        return self._summary(row)
 
     def get_episode(self, episode_id: str) -> EpisodeSummary | None:
         """Get a specific episode summary."""
-        return self._episodes.get(episode_id)
+        row = self._rows.get(episode_id)
+        return None if row is None else self._summary(row)
 
     def get_episode_stats(
         self, agent_name: str, n_episodes: int = 50
     ) -> dict[str, Any]:
         """Get performance statistics over recent episodes for an agent."""
-        episode_ids = self._agent_episodes.get(agent_name, [])[-n_episodes:]
-        episodes = [self._episodes[eid] for eid in episode_ids if eid in self._episodes]
+        rows = self._agent_rows.get(agent_name, [])[-n_episodes:]
 
-        if not episodes:
+        if not rows:
             return {
                 "agent_name": agent_name,
                 "total_episodes": 0,
                 "status": "no episodes recorded",
             }
 
-        completed = [e for e in episodes if e.ended_at is not None]
-        rewards = [e.total_reward for e in completed]
+        idx = np.asarray(rows)
+        durations = self._ended_at[idx] - self._started_at[idx]
+        return self._summarise_rows(agent_name, idx, durations)
 
-        avg_reward = sum(rewards) / len(rewards) if rewards else 0
-        best_reward = max(rewards) if rewards else 0
-        worst_reward = min(rewards) if rewards else 0
+    def get_all_agent_stats(self) -> list[dict[str, Any]]:
+        """Get episode stats for all agents.
+
+        Episode durations are computed for every row in one vector pass
+        and each agent's recent rows are gathered from that column.
+        """
+        size = self._size
+        all_durations = self._ended_at[:size] - self._started_at[:size]
+        stats = []
+        for agent_name in sorted(self._agent_rows.keys()):
+            idx = np.asarray(self._agent_rows[agent_name][-50:])
+            stats.append(self._summarise_rows(agent_name, idx, all_durations.take(idx)))
+        return stats
+
+    def _summarise_rows(
+        self, agent_name: str, idx: np.ndarray, durations: np.ndarray
+    ) -> dict[str, Any]:
+        """Build the episode-stats dict for *agent_name* from row indices *idx*.
 
-        durations = []
-        for e in completed:
-            if e.ended_at and e.started_at:
-                durations.append((e.ended_at - e.started_at).total_seconds())
+        *durations* is parallel to *idx* and is ``NaN`` for episodes that
+        have not ended.
+        """
+        done = ~np.isnan(durations)
+        completed = idx[done]
+        durations = durations[done]
+        n_completed = len(completed)
+        rewards = self._rewards[completed]
+        steps = self._steps[completed]
 
         return {
             "agent_name": agent_name,
-            "total_episodes": len(episodes),
-            "completed_episodes": len(completed),
-            "avg_reward": round(avg_reward, 4),
-            "best_reward": round(best_reward, 4),
-            "worst_reward": round(worst_reward, 4),
-            "avg_steps": round(
-                sum(e.total_steps for e in completed) / len(completed), 1
-            )
-            if completed
-            else 0,
-            "avg_duration_seconds": round(sum(durations) / len(durations), 1)
-            if durations
-            else 0,
-            "reward_history": [round(r, 4) for r in rewards[-20:]],
+            "total_episodes": len(idx),
+            "completed_episodes": n_completed,
+            "avg_reward": round(float(rewards.mean()), 4) if n_completed else 0,
+            "best_reward": round(float(rewards.max()), 4) if n_completed else 0,
+            "worst_reward": round(float(rewards.min()), 4) if n_completed else 0,
+            "avg_steps": round(float(steps.mean()), 1) if n_completed else 0,
+            "avg_duration_seconds": round(float(durations.mean()), 1) if n_completed else 0,
+            "reward_history": [round(r, 4) for r in rewards[-20:].tolist()],
             "recent_outcomes": [
                 {
-                    "episode_id": e.episode_id,
-                    "reward": round(e.total_reward, 4),
-                    "steps": e.total_steps,
-                    "outcome": e.outcome,
-                    "duration": (
-                        (e.ended_at - e.started_at).total_seconds()
-                        if e.ended_at
-                        else None
-                    ),
+                    "episode_id": self._episode_ids[row],
+                    "reward": round(reward, 4),
+                    "steps": n_steps,
+                    "outcome": self._outcomes[row],
+                    "duration": duration,
                 }
-                for e in completed[-10:]
+                for row, reward, n_steps, duration in zip(
+                    completed[-10:].tolist(),
+                    rewards[-10:].tolist(),
+                    steps[-10:].tolist(),
+                    durations[-10:].tolist(),
+                )
             ],
         }
-
-    def get_all_agent_stats(self) -> list[dict[str, Any]]:
-        """Get episode stats for all agents."""
-        return [
-            self.get_episode_stats(agent_name)
-            for agent_name in sorted(self._agent_episodes.keys())
-        ]
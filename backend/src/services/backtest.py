@@ -6,20 +6,251 @@ data and numpy/pandas for quantitative calculations.
 """
 
 import asyncio
+import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
+from numpy.typing import ArrayLike
 
 from src.config import settings
+from src.data.sources.yahoo_download import download
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+_EMPTY_HOLDING_STATS: dict[str, Any] = {
+    "win_rate": 0.0,
+    "avg_return": 0.0,
+    "median_return": 0.0,
+    "max_drawdown": 0.0,
+    "std_return": 0.0,
+    "sample_size": 0,
+}
+
+
+def _simple_returns(close: np.ndarray) -> np.ndarray:
+    """Bar-to-bar simple returns, computed as ``Series.pct_change`` does."""
+    return close[1:] / close[:-1] - 1
+
+
+def _select_nonoverlapping(signal: np.ndarray, holding_period: int) -> np.ndarray:
+    """Pick entry positions from a boolean signal, skipping each holding period.
+
+    Mirrors a bar-by-bar scan that jumps *holding_period* bars ahead after
+    every entry, but only visits the positions where the signal fires.
+    """
+    entries: list[int] = []
+    next_free = 0
+    for i in np.flatnonzero(signal).tolist():
+        if i >= next_free:
+            entries.append(i)
+            next_free = i + holding_period
+    return np.asarray(entries, dtype=np.intp)
+
+
+def _scatter_trade_returns(
+    n: int,
+    entries: np.ndarray,
+    trade_returns: np.ndarray,
+    holding_period: int,
+) -> np.ndarray:
+    """Build the per-step return series of a fixed-holding-period scan.
+
+    The scan emits one step per flat bar and a single step per trade (the
+    bars inside a holding period are skipped), so the result holds the
+    trade return at each entry and zero everywhere else it visited.
+    """
+    returns = np.zeros(n, dtype=np.float64)
+    returns[entries] = trade_returns
+    # Mark the bars skipped while a position is held
+    cover = np.zeros(n + 1, dtype=np.intp)
+    np.add.at(cover, np.minimum(entries + 1, n), 1)
+    np.add.at(cover, np.minimum(entries + holding_period, n), -1)
+    held = np.cumsum(cover[:n]) > 0
+    return returns[~held]
+
+
+def _equity_curve(capital: float, returns: np.ndarray) -> np.ndarray:
+    """Compound *returns* onto *capital*, including the starting value.
+
+    Growth is accumulated in log space (a cumulative sum of ``log1p``)
+    rather than as a serial chain of multiplies. A return of -100% or
+    worse has no logarithm, so such series are compounded directly.
+    """
+    equity = np.empty(len(returns) + 1, dtype=np.float64)
+    equity[0] = capital
+    if len(returns) and returns.min() <= -1.0:
+        np.add(returns, 1.0, out=equity[1:])
+        return np.multiply.accumulate(equity, out=equity)
+
+    np.log1p(returns, out=equity[1:])
+    np.cumsum(equity[1:], out=equity[1:])
+    np.exp(equity[1:], out=equity[1:])
+    equity[1:] *= capital
+    return equity
+
+
+def _fixed_hold_sim(
+    close: np.ndarray,
+    signal: np.ndarray,
+    offset: int,
+    holding_period: int,
+    capital: float,
+) -> dict[str, Any]:
+    """Simulate entering on *signal* and holding each trade a fixed period.
+
+    ``signal[k]`` refers to bar ``offset + k`` of *close*; the scan visits
+    every signal position once and jumps *holding_period* bars after each
+    entry.
+    """
+    entries = _select_nonoverlapping(signal, holding_period)
+    entry_idx = entries + offset
+    exit_idx = np.minimum(entry_idx + holding_period, len(close) - 1)
+    entry_prices = close[entry_idx]
+    trades_returns = (close[exit_idx] - entry_prices) / entry_prices
+
+    portfolio_returns = _scatter_trade_returns(len(signal), entries, trades_returns, holding_period)
+
+    return {
+        "returns": portfolio_returns,
+        "equity": _equity_curve(capital, portfolio_returns),
+        "total_trades": len(trades_returns),
+        "winning_trades": int(np.count_nonzero(trades_returns > 0)),
+        "trade_returns": trades_returns,
+    }
+
+
+def _rolling_mean_std(
+    values: np.ndarray,
+    window: int,
+    out: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trailing-window mean and sample standard deviation in O(N).
+
+    Window sums come from differences of running sums (of the values and
+    of their squares) instead of re-reducing every window. Matches
+    ``Series.rolling(window).mean()`` / ``.std()``: the first
+    ``window - 1`` entries are NaN, any window holding a NaN is NaN, a
+    window of identical values has exactly that mean and a zero deviation,
+    and the deviation uses ``ddof=1``. Pass a ``(2, N)`` float64 *out*
+    buffer to reuse it for the results.
+    """
+    n = len(values)
+    mean, std = np.empty((2, n)) if out is None else out
+    mean.fill(np.nan)
+    std.fill(np.nan)
+    if window < 1 or n < window:
+        return mean, std
+
+    # Gaps enter the running sums as zeros (so they cannot poison every later
+    # window) and are counted separately to blank out the windows they fall in.
+    valid = np.isfinite(values)
+    if not valid.any():
+        return mean, std
+    # Centre the data first so the sum of squares does not cancel catastrophically
+    shift = values[valid].mean()
+    centred = np.where(valid, values - shift, 0.0)
+    sums = np.concatenate(([0.0], np.cumsum(centred)))
+    sq_sums = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    gaps = np.concatenate(([0], np.cumsum(~valid)))
+    window_sum = sums[window:] - sums[:-window]
+    window_sq_sum = sq_sums[window:] - sq_sums[:-window]
+    has_gap = (gaps[window:] - gaps[:-window]) > 0
+
+    # Running-sum differences leave a rounding residual on flat stretches, so
+    # windows of identical values are set exactly, as pandas does by tracking
+    # the run of equal values: z = 0 / 0 = NaN there, not a spurious 0.
+    idx = np.arange(n)
+    run_start = np.maximum.accumulate(
+        np.where(np.concatenate(([True], values[1:] != values[:-1])), idx, 0)
+    )
+    flat = (idx - run_start + 1)[window - 1 :] >= window
+
+    mean[window - 1 :] = np.where(
+        has_gap, np.nan, np.where(flat, values[window - 1 :], window_sum / window + shift)
+    )
+    if window > 1:
+        var = (window_sq_sum - window_sum * window_sum / window) / (window - 1)
+        var[flat] = 0.0
+        std[window - 1 :] = np.where(has_gap, np.nan, np.sqrt(np.maximum(var, 0.0)))
+    return mean, std
+
+
+def _mean_reversion_loop(
+    close: np.ndarray,
+    z_scores: np.ndarray,
+    entry_z: float,
+    exit_z: float,
+    lookback: int,
+    capital: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run the mean reversion state machine over raw price and z-score arrays.
+
+    ``position`` is ``1`` (long), ``-1`` (short) or ``0`` (flat), so P&L is
+    simply ``position`` times the price move and both exit rules collapse
+    to ``position * z >= -exit_z``. The loop only records state changes
+    (the position held through each bar, and each trade's entry bar, exit
+    bar and side); the per-bar and per-trade returns are computed from
+    those arrays afterwards. Returns the per-bar portfolio returns, the
+    equity curve and the closed trade returns.
+    """
+    zs = z_scores.tolist()
+    bars = range(lookback, len(zs))
+
+    # Position held through each bar after the warm-up
+    held = np.zeros(len(bars), dtype=np.int8)
+    # A trade spans at least two bars (entry, then an exit check), plus one left open
+    max_trades = len(bars) // 2 + 1
+    trade_entries = np.empty(max_trades, dtype=np.intp)
+    trade_exits = np.empty(max_trades, dtype=np.intp)
+    trade_sides = np.empty(max_trades, dtype=np.int8)
+    n_trades = 0
+    position = 0
+
+    for k, i in enumerate(bars):
+        z = zs[i]
+        if position == 0:
+            # Look for entry signals; a long signal wins if both fire
+            position = 1 if z <= -entry_z else -int(z >= entry_z)
+            trade_entries[n_trades] = i
+        else:
+            held[k] = position
+            if position * z >= -exit_z:
+                trade_exits[n_trades] = i
+                trade_sides[n_trades] = position
+                n_trades += 1
+                position = 0
+
+    # Close any open position at the end
+    if position:
+        trade_exits[n_trades] = len(zs) - 1
+        trade_sides[n_trades] = position
+        n_trades += 1
+
+    entry_prices = close[trade_entries[:n_trades]]
+    trades_returns = (
+        trade_sides[:n_trades] * (close[trade_exits[:n_trades]] - entry_prices) / entry_prices
+    )
+
+    bar_idx = np.arange(lookback, len(zs))
+    prev_prices = close[bar_idx - 1]
+    in_position = held != 0
+    portfolio_returns = np.zeros(len(bars), dtype=np.float64)
+    portfolio_returns[in_position] = (
+        held[in_position]
+        * (close[bar_idx[in_position]] - prev_prices[in_position])
+        / prev_prices[in_position]
+    )
+
+    return portfolio_returns, _equity_curve(capital, portfolio_returns), trades_returns
+
+
 @dataclass
 class BacktestResult:
     """Container for backtesting results and performance metrics."""
@@ -37,6 +268,26 @@ class BacktestResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class MarketData:
+    """Historical data for one ticker, converted to NumPy once at fetch time.
+
+    ``close`` and ``dates`` are what the simulations work on; ``df`` keeps
+    the full OHLCV frame for anything that needs the other columns.
+    """
+
+    close: np.ndarray
+    dates: np.ndarray
+    df: pd.DataFrame
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "MarketData":
+        close = df["Close"].to_numpy(dtype=np.float64)
+        # Cached arrays are shared between backtests, so guard them against writes
+        close.flags.writeable = False
+        return cls(close=close, dates=df.index.to_numpy(), df=df)
+
+
 class BacktestEngine:
     """Engine for running backtests on various trading strategies.
 
@@ -49,15 +300,104 @@ class BacktestEngine:
     TRADING_DAYS_PER_YEAR = 252
     RISK_FREE_RATE = 0.05  # Annualized risk-free rate assumption
 
-    def __init__(self) -> None:
-        self._data_cache: dict[str, pd.DataFrame] = {}
+    DATA_CACHE_SIZE = 256  # Max OHLCV frames kept in memory
+    DISK_CACHE_FILES = 2048  # Max parquet files kept on disk (LRU by mtime)
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self._data_cache: OrderedDict[str, MarketData] = OrderedDict()
+        cache_dir = settings.backtest_cache_dir if cache_dir is None else cache_dir
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        # (daily returns aligned with close, mean, std) per data cache key
+        self._stats_cache: dict[str, tuple[np.ndarray, float, float]] = {}
+        self._scratch_buf = np.empty((2, 0))
+
+    # ------------------------------------------------------------------
+    # Market data cache: in-memory LRU backed by parquet files on disk
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, cache_key: str) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{cache_key.replace('/', '-')}.parquet"
+
+    def _remember(self, cache_key: str, data: MarketData) -> None:
+        """Insert *data* into the in-memory LRU, evicting the oldest entry."""
+        self._data_cache[cache_key] = data
+        self._data_cache.move_to_end(cache_key)
+        if len(self._data_cache) > self.DATA_CACHE_SIZE:
+            evicted, _ = self._data_cache.popitem(last=False)
+            self._stats_cache.pop(evicted, None)
+
+    def _read_disk(self, cache_key: str) -> MarketData | None:
+        path = self._cache_path(cache_key)
+        if path is None or not path.exists():
+            return None
+        try:
+            data = MarketData.from_frame(pd.read_parquet(path))
+            # mtime doubles as the last-used time for disk eviction
+            os.utime(path)
+            return data
+        except (ImportError, OSError, ValueError):
+            logger.warning("backtest_cache_read_failed", path=str(path), exc_info=True)
+            return None
+
+    def _write_disk(self, cache_key: str, data: pd.DataFrame) -> None:
+        path = self._cache_path(cache_key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(path)
+        except (ImportError, OSError, ValueError):
+            logger.warning("backtest_cache_write_failed", path=str(path), exc_info=True)
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete the least recently used parquet files beyond DISK_CACHE_FILES.
+
+        Keys embed the end date, so without this every ticker would leave a
+        new file behind each day.
+        """
+        if self._cache_dir is None:
+            return
+        try:
+            files = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in os.scandir(self._cache_dir)
+                if entry.name.endswith(".parquet")
+            ]
+        except OSError:
+            logger.warning("backtest_cache_scan_failed", path=str(self._cache_dir), exc_info=True)
+            return
+        excess = len(files) - self.DISK_CACHE_FILES
+        if excess <= 0:
+            return
+        files.sort()
+        for _, stale in files[:excess]:
+            try:
+                os.remove(stale)
+            except OSError:
+                # Already gone (e.g. another worker evicted it)
+                pass
+
+    async def _get_cached(self, cache_key: str) -> MarketData | None:
+        """Look up *cache_key* in memory, then on disk."""
+        data = self._data_cache.get(cache_key)
+        if data is not None:
+            self._data_cache.move_to_end(cache_key)
+            return data
+        data = await asyncio.to_thread(self._read_disk, cache_key)
+        if data is not None:
+            self._remember(cache_key, data)
+        return data
 
     async def _fetch_data(
         self,
         ticker: str,
         start_date: str,
         end_date: str,
-    ) -> pd.DataFrame:
+    ) -> MarketData:
         """Fetch historical OHLCV data from yfinance.
 
         Args:
@@ -66,14 +406,15 @@ class BacktestEngine:
             end_date: End date in YYYY-MM-DD format.
 
         Returns:
-            DataFrame with OHLCV data indexed by date.
+            MarketData with the close array, dates and the OHLCV DataFrame.
         """
         cache_key = f"{ticker}_{start_date}_{end_date}"
-        if cache_key in self._data_cache:
-            return self._data_cache[cache_key]
+        cached = await self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         def _download() -> pd.DataFrame:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+            data = download(ticker, start=start_date, end=end_date, progress=False)
             return data
 
         logger.info("fetching_market_data", ticker=ticker, start=start_date, end=end_date)
@@ -86,46 +427,123 @@ class BacktestEngine:
         if isinstance(data.columns, pd.MultiIndex):
             data.columns = data.columns.get_level_values(0)
 
-        self._data_cache[cache_key] = data
-        return data
+        market_data = MarketData.from_frame(data)
+        self._remember(cache_key, market_data)
+        await asyncio.to_thread(self._write_disk, cache_key, data)
+        return market_data
 
-    @staticmethod
-    def _calculate_sharpe(
-        returns: pd.Series,
-        risk_free_rate: float = 0.05,
-        periods_per_year: int = 252,
-    ) -> float:
-        """Calculate the annualized Sharpe ratio.
+    async def _fetch_many(
+        self,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, MarketData]:
+        """Fetch historical OHLCV data for several tickers in one download.
+
+        Tickers already in the cache are served from it; the rest are
+        requested with a single threaded ``yf.download`` call and cached
+        under the same per-ticker keys that :meth:`_fetch_data` uses.
 
         Args:
-            returns: Series of periodic returns.
-            risk_free_rate: Annualized risk-free rate.
-            periods_per_year: Number of trading periods per year.
+            tickers: Stock ticker symbols.
+            start_date: Start date in YYYY-MM-DD format.
+            end_date: End date in YYYY-MM-DD format.
 
         Returns:
-            Annualized Sharpe ratio.
+            Mapping of ticker to its MarketData.
         """
-        if returns.std() == 0 or len(returns) < 2:
-            return 0.0
-        excess = returns.mean() - (risk_free_rate / periods_per_year)
-        return float(excess / returns.std() * np.sqrt(periods_per_year))
+        frames: dict[str, MarketData] = {}
+        missing: list[str] = []
+        for ticker in dict.fromkeys(tickers):
+            cached = await self._get_cached(f"{ticker}_{start_date}_{end_date}")
+            if cached is not None:
+                frames[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return frames
+
+        def _download() -> pd.DataFrame:
+            return download(
+                missing,
+                start=start_date,
+                end=end_date,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+
+        logger.info("fetching_market_data", tickers=missing, start=start_date, end=end_date)
+        data = await asyncio.to_thread(_download)
+        downloaded = (
+            set(data.columns.get_level_values(0))
+            if isinstance(data.columns, pd.MultiIndex)
+            else set()
+        )
+
+        for ticker in missing:
+            frame = data[ticker].dropna(how="all") if ticker in downloaded else pd.DataFrame()
+            if frame.empty:
+                raise ValueError(
+                    f"No data returned for {ticker} between {start_date} and {end_date}"
+                )
+            cache_key = f"{ticker}_{start_date}_{end_date}"
+            frames[ticker] = MarketData.from_frame(frame)
+            self._remember(cache_key, frames[ticker])
+            await asyncio.to_thread(self._write_disk, cache_key, frame)
+
+        return frames
 
     @staticmethod
-    def _calculate_max_drawdown(equity_curve: pd.Series) -> float:
+    def _calculate_max_drawdown(equity_curve: np.ndarray) -> float:
         """Calculate the maximum drawdown from an equity curve.
 
         Args:
-            equity_curve: Series of portfolio values over time.
+            equity_curve: Array of portfolio values over time.
 
         Returns:
             Maximum drawdown as a negative fraction (e.g. -0.15 for 15% drawdown).
         """
-        if equity_curve.empty:
+        if len(equity_curve) == 0:
             return 0.0
-        running_max = equity_curve.cummax()
+        running_max = np.maximum.accumulate(equity_curve)
         drawdown = (equity_curve - running_max) / running_max
         return float(drawdown.min())
 
+    def _summary_stats(
+        self,
+        returns: np.ndarray,
+        equity_curve: np.ndarray,
+    ) -> tuple[float, float, float, float]:
+        """Compute the headline performance metrics of a backtest.
+
+        Each reduction over *returns* (product, mean, standard deviation)
+        is taken once and shared between the total return and the Sharpe
+        ratio.
+
+        Args:
+            returns: Array of periodic strategy returns.
+            equity_curve: Array of portfolio values over time.
+
+        Returns:
+            Tuple of (total_return, annualized_return, sharpe_ratio, max_drawdown).
+        """
+        n_days = len(returns)
+        total_return = float(np.prod(1 + returns) - 1) if n_days else 0.0
+        annualized_return = float(
+            (1 + total_return) ** (self.TRADING_DAYS_PER_YEAR / max(n_days, 1)) - 1
+        )
+
+        sharpe = 0.0
+        if n_days >= 2:
+            std = returns.std(ddof=1)
+            if std != 0:
+                excess = returns.mean() - self.RISK_FREE_RATE / self.TRADING_DAYS_PER_YEAR
+                sharpe = float(excess / std * np.sqrt(self.TRADING_DAYS_PER_YEAR))
+
+        return total_return, annualized_return, sharpe, self._calculate_max_drawdown(equity_curve)
+
     # ------------------------------------------------------------------
     # Generic strategy runner
     # ------------------------------------------------------------------
@@ -168,20 +586,19 @@ class BacktestEngine:
 
         # Aggregate results across tickers using equal-weight allocation
         capital_per_ticker = initial_capital / max(len(tickers), 1)
-        all_returns: list[float] = []
-        combined_equity: list[float] = []
+        returns_parts: list[np.ndarray] = []
+        equity_parts: list[np.ndarray] = []
+        trade_return_parts: list[np.ndarray] = []
         total_trades = 0
         winning_trades = 0
-        trade_returns: list[float] = []
+
+        frames = await self._fetch_many(tickers, start_date, end_date)
 
         for ticker in tickers:
-            data = await self._fetch_data(ticker, start_date, end_date)
-            close = data["Close"]
-            daily_returns = close.pct_change().dropna()
+            close = frames[ticker].close
 
             if signal_type == "buy_dip":
                 result = self._simulate_buy_dip(
-                    daily_returns,
                     close,
                     capital_per_ticker,
                     sigma_threshold=params.get("sigma_threshold", 2.0),
@@ -205,24 +622,21 @@ class BacktestEngine:
             else:
                 raise ValueError(f"Unknown signal_type: {signal_type}")
 
-            all_returns.extend(result["returns"])
-            combined_equity.extend(result["equity"])
+            returns_parts.append(result["returns"])
+            equity_parts.append(result["equity"])
+            trade_return_parts.append(result["trade_returns"])
             total_trades += result["total_trades"]
             winning_trades += result["winning_trades"]
-            trade_returns.extend(result["trade_returns"])
 
         # Compute aggregate statistics
-        returns_series = pd.Series(all_returns) if all_returns else pd.Series(dtype=float)
-        total_return = float((1 + returns_series).prod() - 1) if not returns_series.empty else 0.0
-        n_days = len(returns_series) if not returns_series.empty else 1
-        annualized_return = float(
-            (1 + total_return) ** (self.TRADING_DAYS_PER_YEAR / max(n_days, 1)) - 1
+        returns_arr = np.concatenate(returns_parts) if returns_parts else np.empty(0)
+        equity_arr = np.concatenate(equity_parts) if equity_parts else np.array([initial_capital])
+        trade_returns = np.concatenate(trade_return_parts) if trade_return_parts else np.empty(0)
+        total_return, annualized_return, sharpe, max_dd = self._summary_stats(
+            returns_arr, equity_arr
         )
-        sharpe = self._calculate_sharpe(returns_series)
-        equity_series = pd.Series(combined_equity) if combined_equity else pd.Series([initial_capital])
-        max_dd = self._calculate_max_drawdown(equity_series)
         win_rate = winning_trades / max(total_trades, 1)
-        avg_trade_ret = float(np.mean(trade_returns)) if trade_returns else 0.0
+        avg_trade_ret = float(trade_returns.mean()) if len(trade_returns) else 0.0
 
         result = BacktestResult(
             total_return=total_return,
@@ -233,8 +647,8 @@ class BacktestEngine:
             total_trades=total_trades,
             avg_trade_return=avg_trade_ret,
             sample_size=len(trade_returns),
-            returns_series=returns_series.tolist(),
-            equity_curve=equity_series.tolist(),
+            returns_series=returns_arr.tolist(),
+            equity_curve=equity_arr.tolist(),
             metadata={
                 "strategy": strategy,
                 "tickers": tickers,
@@ -256,10 +670,19 @@ class BacktestEngine:
     # Internal simulation helpers
     # ------------------------------------------------------------------
 
+    def _scratch(self, n: int) -> np.ndarray:
+        """Return a reusable ``(2, n)`` float64 buffer for simulation temporaries.
+
+        The buffer grows geometrically and is shared by every simulation on
+        this engine, so nothing written to it may outlive the call using it.
+        """
+        if self._scratch_buf.shape[1] < n:
+            self._scratch_buf = np.empty((2, max(n, 2 * self._scratch_buf.shape[1])))
+        return self._scratch_buf[:, :n]
+
     def _simulate_buy_dip(
         self,
-        daily_returns: pd.Series,
-        close: pd.Series,
+        close: ArrayLike,
         capital: float,
         sigma_threshold: float,
         holding_period: int,
@@ -269,49 +692,17 @@ class BacktestEngine:
         Buys when the daily return drops below -sigma_threshold standard
         deviations and holds for *holding_period* trading days.
         """
-        mean_ret = daily_returns.mean()
-        std_ret = daily_returns.std()
-        threshold = mean_ret - sigma_threshold * std_ret
-
-        trades_returns: list[float] = []
-        equity = capital
-        equity_curve: list[float] = [equity]
-        portfolio_returns: list[float] = []
-
-        i = 0
-        dates = daily_returns.index.tolist()
-        while i < len(dates):
-            ret = daily_returns.iloc[i]
-            if ret <= threshold:
-                # Enter position: buy at close
-                entry_idx = close.index.get_loc(dates[i])
-                exit_idx = min(entry_idx + holding_period, len(close) - 1)
-                entry_price = close.iloc[entry_idx]
-                exit_price = close.iloc[exit_idx]
-                trade_ret = float((exit_price - entry_price) / entry_price)
-                trades_returns.append(trade_ret)
-                equity *= 1 + trade_ret
-                equity_curve.append(equity)
-                portfolio_returns.append(trade_ret)
-                # Skip ahead past the holding period
-                i += holding_period
-            else:
-                portfolio_returns.append(0.0)
-                equity_curve.append(equity)
-                i += 1
+        close_arr = np.asarray(close, dtype=np.float64)
+        # Return position i is the move into close position i + 1
+        daily_returns = _simple_returns(close_arr)
+        threshold = np.nanmean(daily_returns) - sigma_threshold * np.nanstd(daily_returns, ddof=1)
 
-        winning = sum(1 for r in trades_returns if r > 0)
-        return {
-            "returns": portfolio_returns,
-            "equity": equity_curve,
-            "total_trades": len(trades_returns),
-            "winning_trades": winning,
-            "trade_returns": trades_returns,
-        }
+        dip = daily_returns <= threshold
+        return _fixed_hold_sim(close_arr, dip, 1, holding_period, capital)
 
     def _simulate_mean_reversion(
         self,
-        close: pd.Series,
+        close: ArrayLike,
         capital: float,
         entry_z: float,
         exit_z: float,
@@ -323,71 +714,35 @@ class BacktestEngine:
         when z-score crosses above -exit_z. Enters short when z-score
         rises above +entry_z and exits when it falls below +exit_z.
         """
-        rolling_mean = close.rolling(window=lookback).mean()
-        rolling_std = close.rolling(window=lookback).std()
-        z_scores = (close - rolling_mean) / rolling_std
-
-        equity = capital
-        equity_curve: list[float] = [equity]
-        portfolio_returns: list[float] = []
-        trades_returns: list[float] = []
-        position: Optional[str] = None  # "long" or "short"
-        entry_price = 0.0
-
-        for i in range(lookback, len(close)):
-            z = z_scores.iloc[i]
-            price = close.iloc[i]
-            prev_price = close.iloc[i - 1]
-
-            if position is None:
-                # Look for entry signals
-                if z <= -entry_z:
-                    position = "long"
-                    entry_price = price
-                elif z >= entry_z:
-                    position = "short"
-                    entry_price = price
-                portfolio_returns.append(0.0)
-                equity_curve.append(equity)
-            elif position == "long":
-                daily_ret = (price - prev_price) / prev_price
-                portfolio_returns.append(daily_ret)
-                equity *= 1 + daily_ret
-                equity_curve.append(equity)
-                if z >= -exit_z:
-                    trade_ret = (price - entry_price) / entry_price
-                    trades_returns.append(trade_ret)
-                    position = None
-            elif position == "short":
-                daily_ret = -(price - prev_price) / prev_price
-                portfolio_returns.append(daily_ret)
-                equity *= 1 + daily_ret
-                equity_curve.append(equity)
-                if z <= exit_z:
-                    trade_ret = -(price - entry_price) / entry_price
-                    trades_returns.append(trade_ret)
-                    position = None
-
-        # Close any open position at the end
-        if position == "long":
-            trade_ret = (close.iloc[-1] - entry_price) / entry_price
-            trades_returns.append(trade_ret)
-        elif position == "short":
-            trade_ret = -(close.iloc[-1] - entry_price) / entry_price
-            trades_returns.append(trade_ret)
-
-        winning = sum(1 for r in trades_returns if r > 0)
+        close_arr = np.asarray(close, dtype=np.float64)
+        rolling_mean, rolling_std = _rolling_mean_std(
+            close_arr, lookback, out=self._scratch(len(close_arr))
+        )
+        # The z-scores overwrite the rolling mean; the loop unboxes them right away
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = np.subtract(close_arr, rolling_mean, out=rolling_mean)
+            np.divide(z_scores, rolling_std, out=z_scores)
+
+        portfolio_returns, equity_curve, trades_returns = _mean_reversion_loop(
+            close_arr,
+            z_scores,
+            entry_z,
+            exit_z,
+            lookback,
+            capital,
+        )
+
         return {
             "returns": portfolio_returns,
             "equity": equity_curve,
             "total_trades": len(trades_returns),
-            "winning_trades": winning,
+            "winning_trades": int(np.count_nonzero(trades_returns > 0)),
             "trade_returns": trades_returns,
         }
 
     def _simulate_momentum(
         self,
-        close: pd.Series,
+        close: ArrayLike,
         capital: float,
         lookback: int,
         holding_period: int,
@@ -397,43 +752,92 @@ class BacktestEngine:
         Enters long when the trailing *lookback*-day return is positive
         and holds for *holding_period* days.
         """
-        trades_returns: list[float] = []
-        equity = capital
-        equity_curve: list[float] = [equity]
-        portfolio_returns: list[float] = []
-
-        i = lookback
-        while i < len(close):
-            trailing_return = (close.iloc[i] - close.iloc[i - lookback]) / close.iloc[i - lookback]
-            if trailing_return > 0:
-                # Enter long
-                entry_price = close.iloc[i]
-                exit_idx = min(i + holding_period, len(close) - 1)
-                exit_price = close.iloc[exit_idx]
-                trade_ret = float((exit_price - entry_price) / entry_price)
-                trades_returns.append(trade_ret)
-                equity *= 1 + trade_ret
-                equity_curve.append(equity)
-                portfolio_returns.append(trade_ret)
-                i += holding_period
-            else:
-                portfolio_returns.append(0.0)
-                equity_curve.append(equity)
-                i += 1
+        close_arr = np.asarray(close, dtype=np.float64)
+        n_steps = max(len(close_arr) - lookback, 0)
 
-        winning = sum(1 for r in trades_returns if r > 0)
-        return {
-            "returns": portfolio_returns,
-            "equity": equity_curve,
-            "total_trades": len(trades_returns),
-            "winning_trades": winning,
-            "trade_returns": trades_returns,
-        }
+        # trailing[k] is the return over the lookback window ending at lookback + k
+        base = close_arr[:n_steps]
+        trailing = (close_arr[lookback:] - base) / base
+        return _fixed_hold_sim(close_arr, trailing > 0, lookback, holding_period, capital)
 
     # ------------------------------------------------------------------
     # Specialized backtest: buy-the-dip (silver example)
     # ------------------------------------------------------------------
 
+    async def _dip_inputs(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+    ) -> tuple[np.ndarray, np.ndarray, float, float]:
+        """Return close prices, daily returns and their mean/std for a window.
+
+        The daily returns keep a leading NaN so they stay aligned with the
+        close prices. Results are memoized per data cache key, so repeated
+        analyses of the same window only redo the threshold comparison.
+        """
+        data = await self._fetch_data(ticker, start_date, end_date)
+        cache_key = f"{ticker}_{start_date}_{end_date}"
+        stats = self._stats_cache.get(cache_key)
+        if stats is None:
+            daily_returns = np.concatenate(([np.nan], _simple_returns(data.close)))
+            stats = (
+                daily_returns,
+                float(np.nanmean(daily_returns)),
+                float(np.nanstd(daily_returns, ddof=1)),
+            )
+            self._stats_cache[cache_key] = stats
+        return (data.close, *stats)
+
+    @staticmethod
+    def _holding_period_stats(
+        close_arr: np.ndarray,
+        dip_idx: np.ndarray,
+        holding_periods: list[int],
+    ) -> dict[int, dict[str, Any]]:
+        """Forward-return statistics of dip entries for each holding period.
+
+        All holding periods are served from one (trades, max_hp + 1) index
+        matrix: column ``hp`` holds each trade's exit bar, and a running
+        minimum of the drawdowns along the rows gives the worst intra-trade
+        drawdown up to that exit.
+        """
+        last_idx = len(close_arr) - 1
+        # An entry on the final bar has no forward window for any holding period
+        entry_idx = dip_idx[dip_idx < last_idx]
+        if not len(entry_idx) or max(holding_periods, default=0) < 1:
+            return {hp: dict(_EMPTY_HOLDING_STATS) for hp in holding_periods}
+
+        # Columns past the last bar for every trade would only repeat it
+        width = min(max(holding_periods), last_idx - int(entry_idx.min())) + 1
+        window = np.minimum(entry_idx[:, None] + np.arange(width), last_idx)
+        entry_prices = close_arr[entry_idx]
+
+        # The drawdown matrix is the bulk of the work and is only reported to a
+        # few digits, so it runs in float32; forward returns stay in float64
+        trade_prices = close_arr.astype(np.float32)[window]
+        running_max = np.maximum.accumulate(trade_prices, axis=1)
+        worst_drawdown = np.minimum.accumulate((trade_prices - running_max) / running_max, axis=1)
+
+        stats: dict[int, dict[str, Any]] = {}
+        for hp in holding_periods:
+            if hp < 1:
+                stats[hp] = dict(_EMPTY_HOLDING_STATS)
+                continue
+
+            col = min(hp, width - 1)
+            forward_returns = (close_arr[window[:, col]] - entry_prices) / entry_prices
+            stats[hp] = {
+                "win_rate": float(np.mean(forward_returns > 0)),
+                "avg_return": float(np.mean(forward_returns)),
+                "median_return": float(np.median(forward_returns)),
+                "max_drawdown": float(np.min(worst_drawdown[:, col])),
+                "std_return": float(np.std(forward_returns)),
+                "sample_size": len(forward_returns),
+            }
+
+        return stats
+
     async def buy_the_dip_backtest(
         self,
         ticker: str,
@@ -457,81 +861,64 @@ class BacktestEngine:
             Dict with per-holding-period statistics: win_rate, avg_return,
             median_return, max_drawdown, and sample_size.
         """
+        results = await self.sigma_sweep(ticker, [sigma_threshold], holding_periods, lookback_years)
+        return results[sigma_threshold]
+
+    async def sigma_sweep(
+        self,
+        ticker: str,
+        sigmas: list[float],
+        holding_periods: list[int] | None = None,
+        lookback_years: int = 10,
+    ) -> dict[float, dict[str, Any]]:
+        """Run the buy-the-dip analysis for several sigma thresholds.
+
+        Market data and the daily return mean/std are computed once for
+        the window; each threshold only recomputes the dip mask.
+
+        Args:
+            ticker: Ticker symbol (e.g. ``"SLV"``).
+            sigmas: Sigma thresholds to analyse.
+            holding_periods: List of forward holding periods in days.
+            lookback_years: How many years of historical data to use.
+
+        Returns:
+            Mapping of sigma threshold to the same dict that
+            :meth:`buy_the_dip_backtest` returns for it.
+        """
         if holding_periods is None:
             holding_periods = [1, 5, 10, 21, 63]
 
         end_date = datetime.now().strftime("%Y-%m-%d")
         start_date = (datetime.now() - timedelta(days=lookback_years * 365)).strftime("%Y-%m-%d")
 
-        data = await self._fetch_data(ticker, start_date, end_date)
-        close = data["Close"]
-        daily_returns = close.pct_change().dropna()
-
-        mean_ret = daily_returns.mean()
-        std_ret = daily_returns.std()
-
-        # Identify dip days: returns worse than -sigma_threshold * std
-        dip_mask = daily_returns <= (mean_ret - sigma_threshold * std_ret)
-        dip_dates = daily_returns[dip_mask].index
-        sample_size = len(dip_dates)
-
-        logger.info(
-            "buy_the_dip_analysis",
-            ticker=ticker,
-            sigma=sigma_threshold,
-            dip_events=sample_size,
+        close_arr, daily_returns, mean_ret, std_ret = await self._dip_inputs(
+            ticker, start_date, end_date
         )
 
-        results: dict[str, Any] = {
-            "ticker": ticker,
-            "sigma_threshold": sigma_threshold,
-            "total_dip_events": sample_size,
-            "analysis_start": start_date,
-            "analysis_end": end_date,
-            "holding_periods": {},
-        }
+        results: dict[float, dict[str, Any]] = {}
+        for sigma_threshold in sigmas:
+            # Identify dip days: returns worse than -sigma_threshold * std
+            dip_idx = np.flatnonzero(daily_returns <= mean_ret - sigma_threshold * std_ret)
+            sample_size = len(dip_idx)
 
-        for hp in holding_periods:
-            forward_returns: list[float] = []
-            max_drawdowns: list[float] = []
-
-            for dip_date in dip_dates:
-                entry_idx = close.index.get_loc(dip_date)
-                exit_idx = min(entry_idx + hp, len(close) - 1)
-
-                if exit_idx <= entry_idx:
-                    continue
-
-                entry_price = close.iloc[entry_idx]
-                exit_price = close.iloc[exit_idx]
-                fwd_ret = float((exit_price - entry_price) / entry_price)
-                forward_returns.append(fwd_ret)
-
-                # Compute intra-trade drawdown
-                trade_slice = close.iloc[entry_idx : exit_idx + 1]
-                running_max = trade_slice.cummax()
-                dd = ((trade_slice - running_max) / running_max).min()
-                max_drawdowns.append(float(dd))
-
-            if forward_returns:
-                fr_arr = np.array(forward_returns)
-                results["holding_periods"][hp] = {
-                    "win_rate": float(np.mean(fr_arr > 0)),
-                    "avg_return": float(np.mean(fr_arr)),
-                    "median_return": float(np.median(fr_arr)),
-                    "max_drawdown": float(np.min(max_drawdowns)) if max_drawdowns else 0.0,
-                    "std_return": float(np.std(fr_arr)),
-                    "sample_size": len(forward_returns),
-                }
-            else:
-                results["holding_periods"][hp] = {
-                    "win_rate": 0.0,
-                    "avg_return": 0.0,
-                    "median_return": 0.0,
-                    "max_drawdown": 0.0,
-                    "std_return": 0.0,
-                    "sample_size": 0,
-                }
+            logger.info(
+                "buy_the_dip_analysis",
+                ticker=ticker,
+                sigma=sigma_threshold,
+                dip_events=sample_size,
+            )
+
+            results[sigma_threshold] = {
+                "ticker": ticker,
+                "sigma_threshold": sigma_threshold,
+                "total_dip_events": sample_size,
+                "analysis_start": start_date,
+                "analysis_end": end_date,
+                "holding_periods": self._holding_period_stats(
+                    close_arr, dip_idx, holding_periods
+                ),
+            }
 
         return results
 
@@ -567,22 +954,16 @@ class BacktestEngine:
         start_date = (datetime.now() - timedelta(days=lookback_years * 365)).strftime("%Y-%m-%d")
 
         data = await self._fetch_data(ticker, start_date, end_date)
-        close = data["Close"]
+        close = data.close
         initial_capital = 100_000.0
 
         sim = self._simulate_mean_reversion(close, initial_capital, entry_z, exit_z, lookback)
 
-        returns_series = pd.Series(sim["returns"])
-        equity_series = pd.Series(sim["equity"])
-        total_return = float((1 + returns_series).prod() - 1) if not returns_series.empty else 0.0
-        n_days = len(returns_series) if not returns_series.empty else 1
-        annualized = float(
-            (1 + total_return) ** (self.TRADING_DAYS_PER_YEAR / max(n_days, 1)) - 1
+        total_return, annualized, sharpe, max_dd = self._summary_stats(
+            sim["returns"], sim["equity"]
         )
-        sharpe = self._calculate_sharpe(returns_series)
-        max_dd = self._calculate_max_drawdown(equity_series)
         win_rate = sim["winning_trades"] / max(sim["total_trades"], 1)
-        avg_tr = float(np.mean(sim["trade_returns"])) if sim["trade_returns"] else 0.0
+        avg_tr = float(sim["trade_returns"].mean()) if len(sim["trade_returns"]) else 0.0
 
         return BacktestResult(
             total_return=total_return,
@@ -593,8 +974,8 @@ class BacktestEngine:
             total_trades=sim["total_trades"],
             avg_trade_return=avg_tr,
             sample_size=sim["total_trades"],
-            returns_series=returns_series.tolist(),
-            equity_curve=equity_series.tolist(),
+            returns_series=sim["returns"].tolist(),
+            equity_curve=sim["equity"].tolist(),
             metadata={
                 "ticker": ticker,
                 "strategy": "mean_reversion",
@@ -633,22 +1014,16 @@ class BacktestEngine:
         start_date = (datetime.now() - timedelta(days=lookback_years * 365)).strftime("%Y-%m-%d")
 
         data = await self._fetch_data(ticker, start_date, end_date)
-        close = data["Close"]
+        close = data.close
         initial_capital = 100_000.0
 
         sim = self._simulate_momentum(close, initial_capital, lookback, holding_period)
 
-        returns_series = pd.Series(sim["returns"])
-        equity_series = pd.Series(sim["equity"])
-        total_return = float((1 + returns_series).prod() - 1) if not returns_series.empty else 0.0
-        n_days = len(returns_series) if not returns_series.empty else 1
-        annualized = float(
-            (1 + total_return) ** (self.TRADING_DAYS_PER_YEAR / max(n_days, 1)) - 1
+        total_return, annualized, sharpe, max_dd = self._summary_stats(
+            sim["returns"], sim["equity"]
         )
-        sharpe = self._calculate_sharpe(returns_series)
-        max_dd = self._calculate_max_drawdown(equity_series)
         win_rate = sim["winning_trades"] / max(sim["total_trades"], 1)
-        avg_tr = float(np.mean(sim["trade_returns"])) if sim["trade_returns"] else 0.0
+        avg_tr = float(sim["trade_returns"].mean()) if len(sim["trade_returns"]) else 0.0
 
         return BacktestResult(
             total_return=total_return,
@@ -659,8 +1034,8 @@ class BacktestEngine:
             total_trades=sim["total_trades"],
             avg_trade_return=avg_tr,
             sample_size=sim["total_trades"],
-            returns_series=returns_series.tolist(),
-            equity_curve=equity_series.tolist(),
+            returns_series=sim["returns"].tolist(),
+            equity_curve=sim["equity"].tolist(),
             metadata={
                 "ticker": ticker,
                 "strategy": "momentum",
@@ -30,6 +30,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -37,7 +38,7 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataSnapshot:
     """Immutable snapshot of market data collected by the pipeline.
 
@@ -58,14 +59,14 @@ class DataSnapshot:
     # Quantitative screen results
     screen_results: list[dict] = field(default_factory=list)
 
-    # Commodity-specific: inventory reports, OPEC data
-    commodity_data: dict[str, Any] = field(default_factory=dict)
+    # Commodity-specific: inventory reports, OPEC data (None until a source provides it)
+    commodity_data: dict[str, Any] | None = None
 
-    # Crypto-specific: on-chain metrics
-    crypto_data: dict[str, Any] = field(default_factory=dict)
+    # Crypto-specific: on-chain metrics (None until a source provides it)
+    crypto_data: dict[str, Any] | None = None
 
-    # Metadata: data quality, staleness, source counts
-    metadata: dict[str, Any] = field(default_factory=dict)
+    # Metadata: data quality, staleness, source counts (set by DataPipeline)
+    metadata: dict[str, Any] | None = None
 
     def to_agent_input(self) -> dict[str, Any]:
         """Convert snapshot to the dict format agents expect."""
@@ -73,8 +74,8 @@ class DataSnapshot:
             "news_items": self.news_items,
             "market_data": {
                 **self.market_data,
-                **(self.commodity_data if self.commodity_data else {}),
-                **(self.crypto_data if self.crypto_data else {}),
+                **(self.commodity_data or {}),
+                **(self.crypto_data or {}),
             },
             "social_signals": self.social_signals,
             "screen_results": self.screen_results,
@@ -86,11 +87,39 @@ class DataCollector:
 
     name: str = "base"
 
+    # How long (seconds) the pipeline may reuse this collector's last result.
+    ttl: float = 60.0
+
+    # Budget (seconds) for one collect() call before the pipeline gives up on it.
+    timeout: float = 8.0
+
+    # Headroom (seconds) between the sources' per-request HTTP timeout and
+    # ``timeout``: a slow feed then fails on its own and the source returns
+    # what the others fetched, instead of the whole collector timing out.
+    REQUEST_RESERVE: float = 2.0
+
+    @property
+    def request_timeout(self) -> float:
+        """Per-request HTTP timeout for the sources this collector wraps."""
+        return max(self.timeout - self.REQUEST_RESERVE, 1.0)
+
     async def collect(self) -> dict[str, Any]:
         """Collect data from this source. Returns raw data dict."""
         raise NotImplementedError
 
 
+_rss_source: Any = None
+
+
+def _get_rss_source(request_timeout: float) -> Any:
+    """Process-wide RSSNewsSource, so per-feed ETag/Last-Modified survive between runs."""
+    global _rss_source
+    if _rss_source is None:
+        from src.data.sources.news_rss import RSSNewsSource
+        _rss_source = RSSNewsSource(request_timeout=request_timeout)
+    return _rss_source
+
+
 class NewsCollector(DataCollector):
     """Collects news from RSS feeds and optional news APIs.
 
@@ -112,8 +141,7 @@ class NewsCollector(DataCollector):
 
         # 1. RSS feeds — always available, no API key needed
         try:
-            from src.data.sources.news_rss import RSSNewsSource
-            rss = RSSNewsSource()
+            rss = _get_rss_source(self.request_timeout)
             rss_items = await rss.fetch()
             for item in rss_items:
                 d = asdict(item)
@@ -138,6 +166,9 @@ class MarketDataCollector(DataCollector):
     """Collects market prices, volumes, and technical indicators via yfinance."""
 
     name = "market_data"
+    ttl = 10.0
+    # Leaves room for the paced per-ticker fallback below.
+    timeout = 15.0
 
     def __init__(self, watchlist: list[str] | None = None):
         self.watchlist = watchlist or [
@@ -155,38 +186,65 @@ class MarketDataCollector(DataCollector):
             "UUP", "FXE",
         ]
 
+    # Per-ticker fallback for tickers the batch download misses (typically
+    # when Yahoo rate-limits the bulk request): bounded concurrency, and
+    # launches spaced to stay near ~120 requests/minute.
+    FALLBACK_CONCURRENCY = 4
+    FALLBACK_SPACING = 0.5
+    # The fallback stops this long before the collector's timeout, leaving
+    # room to merge whatever it recovered instead of losing everything.
+    FALLBACK_RESERVE = 1.0
+
     async def collect(self) -> dict[str, Any]:
         """Fetch current prices and daily changes for watchlist."""
         try:
+            import pandas as pd
             import yfinance as yf
+
+            from src.data.sources.yahoo_download import download
             data: dict[str, Any] = {"prices": {}, "changes": {}}
+            loop = asyncio.get_running_loop()
+            fallback_deadline = loop.time() + self.timeout - self.FALLBACK_RESERVE
 
             # Use yfinance download for batch efficiency
             tickers_str = " ".join(self.watchlist)
-            df = yf.download(
-                tickers_str, period="5d", interval="1d",
+            # Off the event loop, so the pipeline's timeout can actually fire.
+            df = await asyncio.to_thread(
+                download, tickers_str, period="5d", interval="1d",
                 progress=False, threads=True,
             )
 
-            if df.empty:
+            closes = pd.DataFrame()
+            if not df.empty:
+                closes = df["Close"]
+                if isinstance(closes, pd.Series):
+                    # Older yfinance returns a flat frame for a single ticker.
+                    closes = closes.to_frame(self.watchlist[0])
+                # Failed tickers come back as all-NaN columns.
+                closes = closes.dropna(axis=1, how="all")
+
+            missing = [t for t in self.watchlist if t not in closes.columns]
+            if missing:
+                fetched = await self._fetch_individually(yf, missing, fallback_deadline)
+                if fetched:
+                    closes = pd.concat([closes, *fetched], axis=1)
+
+            if closes.empty:
                 return {"market_data": data}
 
-            for ticker in self.watchlist:
-                try:
-                    if len(self.watchlist) > 1:
-                        close = df["Close"][ticker]
-                    else:
-                        close = df["Close"]
-                    if close.empty:
-                        continue
-                    last = float(close.iloc[-1])
-                    prev = float(close.iloc[-2]) if len(close) > 1 else last
-                    pct_change = ((last - prev) / prev * 100) if prev != 0 else 0
-
-                    data["prices"][ticker] = round(last, 2)
-                    data["changes"][ticker] = round(pct_change, 2)
-                except (KeyError, IndexError):
-                    continue
+            # Column-wise over the whole watchlist instead of per-ticker iloc.
+            # Forward-fill so tickers with no bar on the latest date (e.g.
+            # equities on a weekend when crypto trades) report their last close.
+            closes = closes.reindex(
+                columns=[t for t in self.watchlist if t in closes.columns]
+            ).sort_index().ffill()
+            last = closes.iloc[-1].dropna()
+            prev = closes.iloc[-2].reindex(last.index) if len(closes) > 1 else last
+            prev = prev.fillna(last)
+            pct_change = ((last - prev) / prev * 100).where(prev != 0, 0.0)
+
+            data["prices"] = last.round(2).to_dict()
+            data["changes"] = pct_change.round(2).to_dict()
 
             return {"market_data": data}
         except ImportError:
@@ -196,6 +254,61 @@ class MarketDataCollector(DataCollector):
             logger.warning("Market data collection failed", exc_info=True)
             return {"market_data": {}}
 
+    async def _fetch_individually(
+        self, yf: Any, tickers: list[str], deadline: float
+    ) -> list[Any]:
+        """Fetch 5-day closes one ticker at a time, concurrently, off the event loop.
+
+        Stops at *deadline* (event-loop time): tickers not fetched by then
+        are dropped and the ones already recovered are kept.  Returns a list
+        of named close Series (one per ticker that came back with data),
+        indexed by naive date so they align with the batch frame.
+        """
+        semaphore = asyncio.Semaphore(self.FALLBACK_CONCURRENCY)
+
+        async def _one(ticker: str) -> Any:
+            async with semaphore:
+                hist = await asyncio.to_thread(lambda: yf.Ticker(ticker).history(period="5d"))
+            if hist.empty:
+                return None
+            close = hist["Close"].rename(ticker)
+            if close.index.tz is not None:
+                close.index = close.index.tz_localize(None)
+            close.index = close.index.normalize()
+            return close
+
+        tasks: list[asyncio.Task[Any]] = []
+        try:
+            async with asyncio.timeout_at(deadline):
+                for i, ticker in enumerate(tickers):
+                    if i:
+                        await asyncio.sleep(self.FALLBACK_SPACING)
+                    tasks.append(asyncio.create_task(_one(ticker)))
+                await asyncio.wait(tasks)
+        except TimeoutError:
+            logger.info(
+                "Market data fallback hit its deadline with %d/%d tickers launched",
+                len(tasks), len(tickers),
+            )
+
+        fetched = []
+        for ticker, task in zip(tickers, tasks):
+            if not task.done():
+                task.cancel()
+            elif task.cancelled():
+                continue
+            elif task.exception() is not None:
+                logger.debug(
+                    "Per-ticker fallback failed for %s: %s", ticker, task.exception()
+                )
+            elif task.result() is not None:
+                fetched.append(task.result())
+        if fetched:
+            logger.info(
+                "Market data fallback recovered %d/%d tickers", len(fetched), len(tickers)
+            )
+        return fetched
+
 
 class SocialCollector(DataCollector):
     """Collects social media signals from Reddit, X/Twitter, and Substack.
@@ -209,54 +322,71 @@ class SocialCollector(DataCollector):
 
     async def collect(self) -> dict[str, Any]:
         """Fetch social signals from all available platforms."""
+        # Both sources share the collector budget, so fetch them side by side.
+        reddit_signals, other_signals = await asyncio.gather(
+            self._collect_reddit(), self._collect_aggregator(),
+        )
+        return {"social_signals": reddit_signals + other_signals}
+
+    async def _collect_reddit(self) -> list[dict]:
+        """Reddit (always works — no auth needed)."""
         from dataclasses import asdict
         from src.data.sources.reddit import RedditSource
-        from src.data.sources.social import SocialAggregatorSource
 
-        all_signals: list[dict] = []
-
-        # 1. Reddit (always works — no auth needed)
+        signals: list[dict] = []
         try:
-            reddit = RedditSource()
+            reddit = RedditSource(request_timeout=self.request_timeout)
             reddit_items = await reddit.fetch(limit=20)
             for item in reddit_items:
                 d = asdict(item)
                 d["platform"] = "reddit"
-                all_signals.append(d)
+                signals.append(d)
         except Exception:
             logger.warning("Reddit collection failed", exc_info=True)
+        return signals
 
-        # 2. Substack + X via the social aggregator
+    async def _collect_aggregator(self) -> list[dict]:
+        """Substack + X via the social aggregator."""
+        from dataclasses import asdict
+        from src.data.sources.social import SocialAggregatorSource
+
+        signals: list[dict] = []
         try:
-            social = SocialAggregatorSource(enabled_platforms=["substack", "twitter"])
+            social = SocialAggregatorSource(
+                enabled_platforms=["substack", "twitter"],
+                request_timeout=self.request_timeout,
+            )
             social_items = await social.fetch(limit=25)
             for item in social_items:
-                d = asdict(item)
-                all_signals.append(d)
+                signals.append(asdict(item))
         except Exception:
             logger.warning("Social aggregator collection failed", exc_info=True)
-
-        return {"social_signals": all_signals}
+        return signals
 
 
 class ScreenCollector(DataCollector):
     """Runs quantitative screens on market data."""
 
     name = "screens"
+    timeout = 15.0
+
+    SCREENS = ("momentum_leaders", "value_opportunities", "unusual_volume")
 
     async def collect(self) -> dict[str, Any]:
         """Run basic screens. Uses backend screening service if available."""
         try:
             from src.services.screening import run_screen
-            # Run a few standard screens
-            results = []
-            for screen_type in ["momentum_leaders", "value_opportunities", "unusual_volume"]:
-                try:
-                    screen_result = await run_screen(screen_type, {})
-                    if screen_result:
-                        results.extend(screen_result[:10])
-                except Exception:
-                    pass
+            # The screens are independent, so run them concurrently.
+            outcomes = await asyncio.gather(
+                *(run_screen(screen_type, {}) for screen_type in self.SCREENS),
+                return_exceptions=True,
+            )
+            results = [
+                row
+                for outcome in outcomes
+                if outcome and not isinstance(outcome, BaseException)
+                for row in outcome[:10]
+            ]
             return {"screen_results": results}
         except ImportError:
             return {"screen_results": []}
@@ -265,6 +395,47 @@ class ScreenCollector(DataCollector):
             return {"screen_results": []}
 
 
+def _record_failure(
+    collector: DataCollector, exc: Exception, source_counts: dict[str, int | str],
+) -> None:
+    if isinstance(exc, TimeoutError):
+        logger.warning("Collector %s timed out after %gs", collector.name, collector.timeout)
+        source_counts[collector.name] = "timeout"
+    else:
+        logger.warning("Collector %s failed: %s", collector.name, exc)
+        source_counts[collector.name] = 0
+
+
+def _merge_result(
+    snapshot: DataSnapshot, source_counts: dict[str, int | str], result: dict[str, Any],
+) -> None:
+    """Merge one collector result into the snapshot, skipping absent keys."""
+    if "news_items" in result:
+        snapshot.news_items.extend(result["news_items"])
+        source_counts["news"] = len(result["news_items"])
+
+    # A single producer per field is the norm, so take its result as-is;
+    # only a second producer pays for a merged copy.  Copy rather than
+    # mutate in place: results may be held in the per-collector cache.
+    if "market_data" in result:
+        if snapshot.market_data:
+            snapshot.market_data = {**snapshot.market_data, **result["market_data"]}
+        else:
+            snapshot.market_data = result["market_data"]
+        source_counts["market_data"] = len(result.get("market_data", {}).get("prices", {}))
+
+    if "social_signals" in result:
+        snapshot.social_signals.extend(result["social_signals"])
+        source_counts["social"] = len(result["social_signals"])
+
+    if "screen_results" in result:
+        if snapshot.screen_results:
+            snapshot.screen_results = [*snapshot.screen_results, *result["screen_results"]]
+        else:
+            snapshot.screen_results = result["screen_results"]
+        source_counts["screens"] = len(result["screen_results"])
+
+
 class DataPipeline:
     """Centralized data pipeline that collects from all sources.
 
@@ -275,6 +446,12 @@ class DataPipeline:
         ideas = await run_parallel_generators(
             snapshot.to_agent_input(), context, llm
         )
+
+    Each collector's result is reused for its own ``ttl``.  A snapshot
+    lives until the first of those expires, and rebuilding it re-runs only
+    the expired collectors.  Concurrent callers share a single in-flight
+    collection, so the agents that run off the same briefing do not each
+    hit RSS, yfinance and Reddit.
     """
 
     def __init__(self) -> None:
@@ -286,38 +463,70 @@ class DataPipeline:
             SocialCollector(),
             ScreenCollector(),
         ]
+        # (monotonic expiry, value) pairs
+        self._cache: tuple[float, DataSnapshot] | None = None
+        self._inflight: asyncio.Task[DataSnapshot] | None = None
+        self._collector_cache: dict[int, tuple[float, dict[str, Any] | Exception]] = {}
+
+    @property
+    def _last_snapshot(self) -> DataSnapshot | None:
+        """Most recent snapshot, regardless of age (None before first collect)."""
+        return self._cache[1] if self._cache is not None else None
+
+    def invalidate(self) -> None:
+        """Drop cached snapshot and collector results; the next collect() refetches."""
+        self._cache = None
+        self._collector_cache.clear()
 
     async def collect(self) -> DataSnapshot:
+        """Return a fresh-enough DataSnapshot, collecting at most once at a time."""
+        if self._cache is not None and time.monotonic() < self._cache[0]:
+            return self._cache[1]
+
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._collect())
+        # shield() so one cancelled caller does not abort the shared collection.
+        return await asyncio.shield(self._inflight)
+
+    async def _run_collector(
+        self, collector: DataCollector,
+    ) -> tuple[float, dict[str, Any] | Exception]:
+        """Run one collector unless its cached outcome is still within its TTL.
+
+        Returns ``(expiry, result)``.  A failure is returned (and cached like
+        a result) rather than raised, so one collector can't cancel its
+        siblings in the task group or be retried on every rebuild.
+        """
+        cached = self._collector_cache.get(id(collector))
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached
+        try:
+            async with asyncio.timeout(collector.timeout):
+                result = await collector.collect()
+        except Exception as exc:
+            result = exc
+        entry = (time.monotonic() + collector.ttl, result)
+        self._collector_cache[id(collector)] = entry
+        return entry
+
+    async def _collect(self) -> DataSnapshot:
         """Run all collectors in parallel and merge into a DataSnapshot."""
         logger.info("Data pipeline: collecting from %d sources", len(self.collectors))
 
-        tasks = [c.collect() for c in self.collectors]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Every collector runs under its own timeout, so the snapshot is
+        # bounded by the slowest budget rather than the slowest upstream.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._run_collector(c)) for c in self.collectors]
+        expiries, results = zip(*(t.result() for t in tasks)) if tasks else ((), ())
 
         snapshot = DataSnapshot()
-        source_counts: dict[str, int] = {}
+        source_counts: dict[str, int | str] = {}
 
         for collector, result in zip(self.collectors, results):
             if isinstance(result, Exception):
-                logger.warning("Collector %s failed: %s", collector.name, result)
-                source_counts[collector.name] = 0
-                continue
-
-            if "news_items" in result:
-                snapshot.news_items.extend(result["news_items"])
-                source_counts["news"] = len(result["news_items"])
-
-            if "market_data" in result:
-                snapshot.market_data.update(result["market_data"])
-                source_counts["market_data"] = len(result.get("market_data", {}).get("prices", {}))
-
-            if "social_signals" in result:
-                snapshot.social_signals.extend(result["social_signals"])
-                source_counts["social"] = len(result["social_signals"])
-
-            if "screen_results" in result:
-                snapshot.screen_results.extend(result["screen_results"])
-                source_counts["screens"] = len(result["screen_results"])
+                _record_failure(collector, result, source_counts)
+            else:
+                _merge_result(snapshot, source_counts, result)
 
         snapshot.metadata = {
             "collected_at": snapshot.timestamp,
@@ -330,11 +539,14 @@ class DataPipeline:
             ", ".join(f"{k}={v}" for k, v in source_counts.items()),
         )
 
+        # Expire with the shortest-lived collector so its TTL is honoured.
+        self._cache = (min(expiries, default=time.monotonic()), snapshot)
         return snapshot
 
     def add_collector(self, collector: DataCollector) -> None:
         """Add a custom data collector to the pipeline."""
         self.collectors.append(collector)
+        self.invalidate()
         logger.info("Added data collector: %s", collector.name)
 
 
@@ -4,20 +4,36 @@ Provides context retrieval from the knowledge library for agent prompts.
 Agents call `get_context()` to receive relevant knowledge entries that
 enrich their decision-making with the latest research and market data.
 
-Current implementation: keyword + ticker matching with recency weighting.
+Current implementation: full-text keyword + ticker matching with recency weighting.
 Future: vector embeddings for semantic similarity search.
 """
 
 import logging
-from datetime import datetime, timedelta
-
-from sqlalchemy import select, or_, func, desc
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from sqlalchemy import JSON, Integer, Select, select, func, desc, case, cast, literal, union_all
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by, array
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.models.knowledge import KnowledgeEntry, KnowledgeCategory, KnowledgeLayer
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\w+")
+
+# Formatted context dicts keyed by (entry id, updated_at): unchanged entries
+# are not re-formatted on every get_context() call.
+_CONTEXT_CACHE_SIZE = 1024
+
+# Rows fetched per round-trip when streaming get_context() results.
+_STREAM_BATCH = 50
+_context_cache: OrderedDict[tuple, dict] = OrderedDict()
+
 # Map agent types to preferred knowledge categories
 _AGENT_CATEGORY_PREFS: dict[str, list[KnowledgeCategory]] = {
     "idea_generator": [
@@ -79,7 +95,34 @@ async def get_context(
     list[dict]
         Knowledge entries formatted for agent consumption.
     """
-    stmt = select(KnowledgeEntry).where(KnowledgeEntry.is_public.is_(True))
+    stmt = _context_query(
+        tickers=tickers,
+        keywords=keywords,
+        layer=layer,
+        agent_type=agent_type,
+        max_entries=max_entries,
+        max_age_days=max_age_days,
+    )
+    # Stream through a server-side cursor so large pulls (index rebuilds,
+    # retraining) format each batch while the next one is in flight; small
+    # limits still arrive in a single batch.
+    result = await session.stream_scalars(stmt.execution_options(yield_per=_STREAM_BATCH))
+    return [_entry_to_context(e) async for e in result]
+
+
+def _context_query(
+    *,
+    tickers: list[str] | None = None,
+    keywords: list[str] | None = None,
+    layer: str | None = None,
+    agent_type: str | None = None,
+    max_entries: int = 10,
+    max_age_days: int | None = None,
+) -> Select:
+    """Build the ranked, limited entry query behind `get_context()`."""
+    # Bare boolean predicate, so it matches ix_knowledge_entries_public_ranking's
+    # ``WHERE is_public`` verbatim and the planner can use the partial index.
+    stmt = select(KnowledgeEntry).where(KnowledgeEntry.is_public)
 
     # Layer filter
     if layer:
@@ -94,23 +137,20 @@ async def get_context(
 
     # Recency filter
     if max_age_days:
-        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        cutoff = _cutoff(max_age_days, int(time.time()) // 60)
         stmt = stmt.where(KnowledgeEntry.created_at >= cutoff)
 
-    # Ticker filter — use JSON contains for the tickers array
+    # Ticker filter — any-of (``?|``) against the GIN-indexed jsonb cast
     if tickers:
-        ticker_conditions = [
-            KnowledgeEntry.tickers.contains([t]) for t in tickers
-        ]
-        stmt = stmt.where(or_(*ticker_conditions))
+        stmt = stmt.where(cast(KnowledgeEntry.tickers, JSONB).has_any(array(tickers)))
 
-    # Keyword search in title and content (simple ILIKE matching)
+    # Keyword search in title and content via the GIN-indexed tsvector
     if keywords:
-        kw_conditions = []
-        for kw in keywords:
-            kw_conditions.append(KnowledgeEntry.title.ilike(f"%{kw}%"))
-            kw_conditions.append(KnowledgeEntry.content.ilike(f"%{kw}%"))
-        stmt = stmt.where(or_(*kw_conditions))
+        ts_query = _keywords_to_tsquery(keywords)
+        if ts_query:
+            stmt = stmt.where(
+                KnowledgeEntry.search_vector.op("@@")(func.to_tsquery("english", ts_query))
+            )
 
     # Order by credibility * recency, then limit
     stmt = stmt.order_by(
@@ -118,14 +158,64 @@ async def get_context(
         desc(KnowledgeEntry.created_at),
     ).limit(max_entries)
 
-    result = await session.execute(stmt)
-    entries = result.scalars().all()
+    return stmt
+
+
+@lru_cache(maxsize=16)
+def _cutoff(days: int, minute: int) -> datetime:
+    """Recency cutoff ``days`` ago, memoized per wall-clock minute.
+
+    Returned naive (UTC) to match the ``TIMESTAMP WITHOUT TIME ZONE``
+    ``created_at`` column.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now - timedelta(days=days)
+
+
+def _keywords_to_tsquery(keywords: list[str]) -> str:
+    """Build a ``to_tsquery`` string matching any keyword.
 
-    return [_entry_to_context(e) for e in entries]
+    Each keyword becomes an AND of its words and keywords are OR'd together,
+    e.g. ``["rate cut", "CPI"]`` -> ``"(rate & cut) | (CPI)"``.  Only word
+    characters are kept so user input can't produce tsquery syntax errors.
+    """
+    terms = []
+    for kw in keywords:
+        words = _WORD_RE.findall(kw)
+        if words:
+            terms.append("(" + " & ".join(words) + ")")
+    return " | ".join(terms)
 
 
 def _entry_to_context(entry: KnowledgeEntry) -> dict:
-    """Format a knowledge entry for agent context consumption."""
+    """Format a knowledge entry for agent context consumption.
+
+    Memoized per ``(id, updated_at)``; callers get their own copy of the
+    dict and its lists so they may modify either freely.
+    """
+    key = (entry.id, entry.updated_at or entry.created_at)
+    cached = _context_cache.get(key)
+    if cached is not None:
+        _context_cache.move_to_end(key)
+        return _copy_context(cached)
+
+    context = _format_entry(entry)
+    _context_cache[key] = context
+    if len(_context_cache) > _CONTEXT_CACHE_SIZE:
+        _context_cache.popitem(last=False)
+    return _copy_context(context)
+
+
+def _copy_context(context: dict) -> dict:
+    return {
+        **context,
+        "tickers": list(context["tickers"]),
+        "asset_classes": list(context["asset_classes"]),
+        "tags": list(context["tags"]),
+    }
+
+
+def _format_entry(entry: KnowledgeEntry) -> dict:
     return {
         "id": entry.id,
         "title": entry.title,
@@ -160,20 +250,25 @@ def format_context_for_prompt(entries: list[dict], max_chars: int = 8000) -> str
     if not entries:
         return "No relevant knowledge entries found."
 
-    sections = []
+    sections: list[str] = []
     total = 0
 
     for i, entry in enumerate(entries, 1):
-        section = (
-            f"[{i}] {entry['title']} "
-            f"(source: {entry['source']}, confidence: {entry['confidence']:.0%}, "
-            f"layer: {entry['layer']})\n"
-            f"{entry['content']}\n"
-            f"Tickers: {', '.join(entry['tickers']) if entry['tickers'] else 'N/A'}\n"
-            f"Tags: {', '.join(entry['tags']) if entry['tags'] else 'N/A'}"
-        )
-
-        if total + len(section) > max_chars:
+        tickers = entry["tickers"]
+        tags = entry["tags"]
+        section = "".join((
+            f"[{i}] {entry['title']} ",
+            f"(source: {entry['source']}, confidence: {entry['confidence']:.0%}, ",
+            f"layer: {entry['layer']})\n",
+            entry["content"],
+            "\nTickers: ",
+            ", ".join(tickers) if tickers else "N/A",
+            "\nTags: ",
+            ", ".join(tags) if tags else "N/A",
+        ))
+
+        size = len(section)
+        if total + size > max_chars:
             # Truncate this section to fit
             remaining = max_chars - total - 50
             if remaining > 200:
@@ -181,10 +276,95 @@ def format_context_for_prompt(entries: list[dict], max_chars: int = 8000) -> str
             break
 
         sections.append(section)
-        total += len(section)
+        total += size
+
+    return "".join((
+        f"=== Knowledge Context ({len(sections)} entries) ===\n\n",
+        "\n\n---\n\n".join(sections),
+    ))
+
+
+_SECTION_FORMAT = (
+    "[%s] %s (source: %s, confidence: %s%%, layer: %s)\n%s\nTickers: %s\nTags: %s"
+)
+_SECTION_SEPARATOR = "\n\n---\n\n"
+
+
+async def get_formatted_context(
+    session: AsyncSession,
+    *,
+    tickers: list[str] | None = None,
+    keywords: list[str] | None = None,
+    layer: str | None = None,
+    agent_type: str | None = None,
+    max_entries: int = 10,
+    max_age_days: int | None = None,
+    max_chars: int = 8000,
+) -> str:
+    """Like `format_context_for_prompt(await get_context(...))`, formatted in Postgres.
+
+    Sections are rendered with ``format()`` and joined with ``string_agg``,
+    so a single text cell (cut to ``max_chars`` server-side) crosses the
+    wire instead of every entry's columns.  Use `get_context()` when the
+    structured entries are needed.  Unlike the Python formatter, an
+    overlong block is cut once at the end rather than per section.
+    """
+    ranked = _context_query(
+        tickers=tickers,
+        keywords=keywords,
+        layer=layer,
+        agent_type=agent_type,
+        max_entries=max_entries,
+        max_age_days=max_age_days,
+    ).subquery()
+
+    def _joined(json_list):
+        # JSON null (or any non-array) would make json_array_elements_text
+        # raise; treat it as empty, like ``entry.tickers or []``.
+        json_list = case(
+            (func.json_typeof(json_list) == "array", json_list),
+            else_=cast(literal("[]"), JSON),
+        )
+        elements = func.json_array_elements_text(json_list).table_valued("value")
+        return func.coalesce(
+            select(func.string_agg(elements.c.value, ", ")).scalar_subquery(), "N/A"
+        )
+
+    rank = func.row_number().over(
+        order_by=(desc(ranked.c.source_credibility_score), desc(ranked.c.created_at))
+    )
+    sections = select(
+        rank.label("rank"),
+        func.format(
+            _SECTION_FORMAT,
+            rank,
+            ranked.c.title,
+            # nullif mirrors the Python ``or`` fallbacks: "" and 0.0 count as missing.
+            func.coalesce(func.nullif(ranked.c.source, ""), "unknown"),
+            cast(
+                func.round(
+                    func.coalesce(func.nullif(ranked.c.source_credibility_score, 0), 0.5) * 100
+                ),
+                Integer,
+            ),
+            func.lower(ranked.c.layer),
+            ranked.c.content,
+            _joined(ranked.c.tickers),
+            _joined(ranked.c.tags),
+        ).label("section"),
+    ).subquery()
+
+    body = func.string_agg(
+        sections.c.section, aggregate_order_by(literal(_SECTION_SEPARATOR), sections.c.rank)
+    )
+    stmt = select(func.count(), func.left(body, max_chars + 1)).select_from(sections)
+    count, text = (await session.execute(stmt)).one()
 
-    header = f"=== Knowledge Context ({len(sections)} entries) ===\n\n"
-    return header + "\n\n---\n\n".join(sections)
+    if not count:
+        return "No relevant knowledge entries found."
+    if len(text) > max_chars:
+        text = text[:max_chars] + "\n... (truncated)"
+    return f"=== Knowledge Context ({count} entries) ===\n\n{text}"
 
 
 async def get_context_for_agent(
@@ -207,21 +387,31 @@ async def get_context_for_agent(
     elif agent_type in ("portfolio_constructor", "rebalancer"):
         layer = "medium_term"
 
-    entries = await get_context(
-        session,
+    targeted = _context_query(
         tickers=tickers,
         keywords=keywords,
         layer=layer,
         agent_type=agent_type,
         max_entries=8,
+    ).add_columns(literal(0).label("tier"))
+    # Recent high-confidence entries, used only if nothing targeted matches.
+    # Fetched in the same round-trip instead of a second query.
+    fallback = _context_query(
+        agent_type=agent_type,
+        max_entries=5,
+    ).add_columns(literal(1).label("tier"))
+
+    combined = union_all(targeted, fallback).subquery()
+    entry = aliased(KnowledgeEntry, combined)
+    stmt = select(entry, combined.c.tier).order_by(
+        combined.c.tier,
+        desc(combined.c.source_credibility_score),
+        desc(combined.c.created_at),
     )
+    rows = (await session.execute(stmt)).all()
 
-    # If no targeted results, fall back to recent high-confidence entries
+    entries = [_entry_to_context(e) for e, tier in rows if tier == 0]
     if not entries:
-        entries = await get_context(
-            session,
-            agent_type=agent_type,
-            max_entries=5,
-        )
+        entries = [_entry_to_context(e) for e, _ in rows]
 
     return format_context_for_prompt(entries)
@@ -11,13 +11,13 @@ Handles the full workflow:
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import math
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -86,75 +86,168 @@ TRADING_COSTS = {
     "sec_fee_per_million": 22.90,    # SEC fee per $1M of sells
 }
 
+# Bound once so the per-trade cost path does no dict lookups
+_ETF_SPREAD_BPS = TRADING_COSTS["etf_spread_bps"]
+_EQUITY_SPREAD_BPS = TRADING_COSTS["equity_spread_bps"]
+_CRYPTO_SPREAD_BPS = TRADING_COSTS["crypto_spread_bps"]
+_MARKET_IMPACT_BPS = TRADING_COSTS["market_impact_bps"]
+_COMMISSION_PER_SHARE = TRADING_COSTS["commission_per_share"]
+_MIN_COMMISSION = TRADING_COSTS["min_commission"]
+# Anything not listed here is priced as a single stock
+_SPREAD_BPS_BY_INSTRUMENT = {"crypto": _CRYPTO_SPREAD_BPS, "etf": _ETF_SPREAD_BPS}
+
+# ASSET_UNIVERSE flattened once, in universe order, as
+# (ticker, name, asset_class, sub_class, instrument) rows, plus parallel
+# per-field arrays so generate_proposal can size every holding in a single
+# vectorised pass.
+_FLAT_UNIVERSE: list[tuple[str, str, str, str, str]] = [
+    (a["ticker"], a["name"], asset_class, a["sub_class"], a["instrument"])
+    for asset_class, assets in ASSET_UNIVERSE.items()
+    for a in assets
+]
+_INSTRUMENT_BY_TICKER: dict[str, str] = {
+    ticker: instrument for ticker, _, _, _, instrument in _FLAT_UNIVERSE
+}
+_TICKERS, _NAMES, _CLASS_OF, _SUB_CLASSES, _INSTRUMENTS = (
+    list(column) for column in zip(*_FLAT_UNIVERSE)
+)
+
+_INTRA_W = np.array(
+    [INTRA_CLASS_WEIGHTS.get(ac, {}).get(t, 0) for ac, t in zip(_CLASS_OF, _TICKERS)],
+    dtype=np.float64,
+)
+_IS_CRYPTO = np.array([i == "crypto" for i in _INSTRUMENTS])
+_SPREAD_BPS = np.array(
+    [_SPREAD_BPS_BY_INSTRUMENT.get(i, _EQUITY_SPREAD_BPS) for i in _INSTRUMENTS],
+    dtype=np.float64,
+)
+# Universe positions of each asset class's priced instruments
+_CLASS_INDEX: dict[str, np.ndarray] = {
+    ac: np.flatnonzero((np.array(_CLASS_OF) == ac) & (_INTRA_W > 0))
+    for ac in ASSET_UNIVERSE
+}
 
-def compute_trading_cost(
-    ticker: str,
-    quantity: float,
-    price: float,
-    instrument: str,
-) -> dict[str, float]:
-    """Simulate realistic trading costs for a single trade."""
-    notional = quantity * price
 
-    # Spread cost
-    if instrument == "crypto":
-        spread_bps = TRADING_COSTS["crypto_spread_bps"]
-    elif instrument == "etf":
-        spread_bps = TRADING_COSTS["etf_spread_bps"]
-    else:
-        spread_bps = TRADING_COSTS["equity_spread_bps"]
+def _allocation_layout(
+    class_targets: dict[str, float],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Universe rows to buy, in *class_targets* order, with their weights.
 
+    Returns ``(idx, class_weight, intra_weight)``; a row's target notional is
+    ``amount * class_weight * intra_weight`` (multiplied in that order, as
+    the scalar version did, so quantities round identically).
+    """
+    idx = np.concatenate(
+        [_CLASS_INDEX[ac] for ac in class_targets if ac in _CLASS_INDEX]
+        or [np.empty(0, dtype=np.intp)]
+    )
+    class_weight = np.array(
+        [class_targets[_CLASS_OF[i]] for i in idx], dtype=np.float64
+    )
+    return idx, class_weight, _INTRA_W[idx]
+
+
+# Layouts for the preset risk profiles, so the common no-custom-targets
+# path does no per-call weight work.
+_PROFILE_LAYOUTS: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {
+    risk: _allocation_layout(
+        {k: v / 100.0 for k, v in profile.items() if k != "cash"}
+    )
+    for risk, profile in RISK_PROFILES.items()
+}
+
+
+def compute_trading_costs_batch(
+    quantities: np.ndarray,
+    prices: np.ndarray,
+    spread_bps: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Simulate trading costs for many trades at once.
+
+    Takes parallel arrays of quantities, prices and spreads (in bps) and
+    returns one unrounded float array per cost field, keyed like
+    ``compute_trading_cost``'s result.
+    """
+    quantities = np.asarray(quantities, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    spread_bps = np.asarray(spread_bps, dtype=np.float64)
+    notional = quantities * prices
+
+    # Spread cost
     spread_cost = notional * (spread_bps / 10_000)
 
     # Market impact (proportional to order size, simplified)
-    impact_cost = notional * (TRADING_COSTS["market_impact_bps"] / 10_000)
+    impact_cost = notional * (_MARKET_IMPACT_BPS / 10_000)
 
     # Commission
-    commission = max(
-        quantity * TRADING_COSTS["commission_per_share"],
-        TRADING_COSTS["min_commission"],
-    )
+    commission = np.maximum(quantities * _COMMISSION_PER_SHARE, _MIN_COMMISSION)
 
     # SEC fee (only on sells, but for initialization all are buys, so 0)
-    sec_fee = 0.0
+    sec_fee = np.zeros_like(notional)
 
     total_cost = spread_cost + impact_cost + commission + sec_fee
-    slippage_pct = (total_cost / notional * 100) if notional > 0 else 0
+    slippage_pct = np.divide(
+        total_cost, notional, out=np.zeros_like(notional), where=notional > 0
+    ) * 100
 
     # Effective fill price (slightly worse than last close due to slippage)
-    fill_price = price * (1 + spread_bps / 20_000 + TRADING_COSTS["market_impact_bps"] / 20_000)
+    fill_price = prices * (1 + spread_bps / 20_000 + _MARKET_IMPACT_BPS / 20_000)
 
     return {
-        "spread_cost": round(spread_cost, 2),
-        "impact_cost": round(impact_cost, 2),
-        "commission": round(commission, 2),
-        "sec_fee": round(sec_fee, 2),
-        "total_cost": round(total_cost, 2),
-        "slippage_pct": round(slippage_pct, 4),
-        "fill_price": round(fill_price, 4),
+        "spread_cost": spread_cost,
+        "impact_cost": impact_cost,
+        "commission": commission,
+        "sec_fee": sec_fee,
+        "total_cost": total_cost,
+        "slippage_pct": slippage_pct,
+        "fill_price": fill_price,
+    }
+
+
+# Decimal places each cost field is rounded to when reported
+_COST_ROUNDING = {
+    "spread_cost": 2,
+    "impact_cost": 2,
+    "commission": 2,
+    "sec_fee": 2,
+    "total_cost": 2,
+    "slippage_pct": 4,
+    "fill_price": 4,
+}
+
+
+def compute_trading_cost(
+    ticker: str,
+    quantity: float,
+    price: float,
+    instrument: str,
+) -> dict[str, float]:
+    """Simulate realistic trading costs for a single trade.
+
+    If *instrument* is empty, it is looked up from the asset universe.
+    """
+    instrument = instrument or _INSTRUMENT_BY_TICKER.get(ticker, "")
+    spread_bps = _SPREAD_BPS_BY_INSTRUMENT.get(instrument, _EQUITY_SPREAD_BPS)
+    costs = compute_trading_costs_batch(
+        np.array([quantity]), np.array([price]), np.array([spread_bps])
+    )
+    return {
+        field: round(float(costs[field][0]), digits)
+        for field, digits in _COST_ROUNDING.items()
     }
 
 
 async def fetch_last_close_prices(tickers: list[str]) -> dict[str, float | None]:
-    """Fetch last available close price for each ticker via yfinance."""
-    import yfinance as yf
-
-    def _fetch() -> dict[str, float | None]:
-        prices: dict[str, float | None] = {}
-        for ticker in tickers:
-            try:
-                t = yf.Ticker(ticker)
-                hist = t.history(period="5d")
-                if hist.empty:
-                    prices[ticker] = None
-                else:
-                    prices[ticker] = float(hist["Close"].iloc[-1])
-            except Exception:
-                logger.warning("Failed to fetch price for %s", ticker, exc_info=True)
-                prices[ticker] = None
-        return prices
-
-    return await asyncio.to_thread(_fetch)
+    """Fetch last available close price for each ticker.
+
+    Reads through the shared ``PriceCacheService``: prices refreshed within
+    the last cache interval are served from memory and only the remaining
+    tickers hit yfinance (in one batched download).
+    """
+    from src.services.price_cache import PriceCacheService
+
+    cached = await PriceCacheService.get_instance().get_or_fetch(tickers)
+    return {t: (cached[t].price if t in cached else None) for t in tickers}
 
 
 def generate_proposal(
@@ -178,91 +271,91 @@ def generate_proposal(
             t["asset_class"]: t["target_weight"] / 100.0
             for t in alloc_targets_raw
         }
+        # Cash is whatever is left once holdings and costs are paid for.
+        class_targets.pop("cash", None)
+        idx, class_weight, intra_weight = _allocation_layout(class_targets)
     else:
-        profile = RISK_PROFILES.get(risk_appetite, RISK_PROFILES["moderate"])
-        class_targets = {k: v / 100.0 for k, v in profile.items()}
+        idx, class_weight, intra_weight = _PROFILE_LAYOUTS.get(
+            risk_appetite, _PROFILE_LAYOUTS["moderate"]
+        )
+
+    # Target notional for each universe row, in class order
+    target_notional = initial_amount * class_weight * intra_weight
+
+    # Unpriceable assets (missing or non-positive price) stay in cash
+    price = np.array(
+        [
+            p if (p := prices.get(_TICKERS[i])) is not None and p > 0 else np.nan
+            for i in idx
+        ],
+        dtype=np.float64,
+    )
+    priced = ~np.isnan(price)
+    idx, target_notional, price = idx[priced], target_notional[priced], price[priced]
+
+    # Whole shares for equities/ETFs, fractional (4 decimals) for crypto
+    ratio = target_notional / price
+    quantity = np.where(
+        _IS_CRYPTO[idx], np.floor(ratio * 10000) / 10000, np.floor(ratio)
+    )
+    bought = quantity > 0
+    idx, quantity, price = idx[bought], quantity[bought], price[bought]
 
-    cash_target = class_targets.pop("cash", 0.10)
-    cash_amount = initial_amount * cash_target
+    # Trading costs for every holding at once
+    costs = compute_trading_costs_batch(quantity, price, _SPREAD_BPS[idx])
 
     holdings: list[dict[str, Any]] = []
     total_invested = 0.0
     total_trading_cost = 0.0
     trades: list[dict[str, Any]] = []
 
-    for asset_class, class_weight in class_targets.items():
-        class_amount = initial_amount * class_weight
-        intra_weights = INTRA_CLASS_WEIGHTS.get(asset_class, {})
-        universe = ASSET_UNIVERSE.get(asset_class, [])
-
-        if not intra_weights or not universe:
-            # No instruments for this class — add to cash
-            cash_amount += class_amount
-            continue
-
-        for asset_info in universe:
-            ticker = asset_info["ticker"]
-            intra_w = intra_weights.get(ticker, 0)
-            if intra_w <= 0:
-                continue
-
-            target_notional = class_amount * intra_w
-            price = prices.get(ticker)
-
-            if price is None or price <= 0:
-                # Can't price this asset — allocate to cash
-                cash_amount += target_notional
-                continue
-
-            # Calculate quantity (whole shares for equities/ETFs, fractional for crypto)
-            if asset_info["instrument"] == "crypto":
-                quantity = target_notional / price
-                quantity = math.floor(quantity * 10000) / 10000  # 4 decimal places
-            else:
-                quantity = math.floor(target_notional / price)
-
-            if quantity <= 0:
-                cash_amount += target_notional
-                continue
-
-            # Compute trading costs
-            cost_info = compute_trading_cost(
-                ticker, quantity, price, asset_info["instrument"]
-            )
-
-            actual_notional = quantity * price
-            fill_price = cost_info["fill_price"]
-            actual_cost = quantity * fill_price
-
-            holdings.append({
-                "ticker": ticker,
-                "name": asset_info["name"],
-                "asset_class": asset_class,
-                "sub_class": asset_info["sub_class"],
-                "instrument": asset_info["instrument"],
-                "direction": "long",
-                "quantity": quantity,
-                "price": round(price, 4),
-                "fill_price": fill_price,
-                "market_value": round(actual_notional, 2),
-                "weight": 0,  # computed below
-                "trading_cost": cost_info,
-            })
-
-            trades.append({
-                "ticker": ticker,
-                "name": asset_info["name"],
-                "direction": "buy",
-                "instrument": asset_info["instrument"],
-                "quantity": quantity,
-                "price": round(price, 4),
-                "fill_price": fill_price,
-                "notional": round(actual_notional, 2),
-                **cost_info,
-            })
-
-            total_invested += actual_cost
-            total_trading_cost += cost_info["total_cost"]
+    # Python floats from here on so rounding matches the scalar path.
+    cost_columns = [costs[field].tolist() for field in _COST_ROUNDING]
+    for i, qty, px, *cost_values in zip(
+        idx.tolist(), quantity.tolist(), price.tolist(), *cost_columns
+    ):
+        ticker = _TICKERS[i]
+        instrument = _INSTRUMENTS[i]
+        if instrument != "crypto":
+            qty = int(qty)
+        cost_info = {
+            field: round(value, digits)
+            for (field, digits), value in zip(_COST_ROUNDING.items(), cost_values)
+        }
+
+        actual_notional = qty * px
+        fill = cost_info["fill_price"]
+        actual_cost = qty * fill
+
+        holdings.append({
+            "ticker": ticker,
+            "name": _NAMES[i],
+            "asset_class": _CLASS_OF[i],
+            "sub_class": _SUB_CLASSES[i],
+            "instrument": instrument,
+            "direction": "long",
+            "quantity": qty,
+            "price": round(px, 4),
+            "fill_price": fill,
+            "market_value": round(actual_notional, 2),
+            "weight": 0,  # computed below
+            "trading_cost": cost_info,
+        })
+
+        trades.append({
+            "ticker": ticker,
+            "name": _NAMES[i],
+            "direction": "buy",
+            "instrument": instrument,
+            "quantity": qty,
+            "price": round(px, 4),
+            "fill_price": fill,
+            "notional": round(actual_notional, 2),
+            **cost_info,
+        })
+
+        total_invested += actual_cost
+        total_trading_cost += cost_info["total_cost"]
 
     # Adjust cash for actual investment + trading costs
     cash_amount = initial_amount - total_invested - total_trading_cost
@@ -13,17 +13,33 @@ portfolio totals so that PnL is always up-to-date.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime
+import os
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from src.config import settings
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CachedPrice:
-    """A single cached price entry."""
+    """A single cached price entry.
+
+    Frozen: entries are shared by every reader, and the memoised payloads
+    rely on an entry only changing by being replaced.
+    """
 
     ticker: str
     price: float
@@ -31,7 +47,51 @@ class CachedPrice:
     change: float | None = None
     change_pct: float | None = None
     volume: int | None = None
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at_ns: int = field(default_factory=time.time_ns)
+
+
+# pg advisory lock id shared by every worker/replica refreshing prices.
+# A fixed constant: Python's hash() of a string is salted per process.
+_REFRESH_ADVISORY_LOCK = 0x4F56_5052_4943_4531
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _utc_datetime(ns: int) -> datetime:
+    """Naive UTC datetime for a ``time.time_ns()`` timestamp."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _summarize_history(hist: Any) -> dict[str, Any] | None:
+    """Reduce a 5-day OHLCV frame to the fields stored in ``CachedPrice``."""
+    # Plain arrays: scalar access skips pandas' iloc machinery.
+    close = hist["Close"].to_numpy(dtype=np.float64)
+    has_close = ~np.isnan(close)
+    close = close[has_close]
+    if close.size == 0:
+        return None
+
+    current = float(close[-1])
+    prev = float(close[-2]) if close.size >= 2 else None
+    volume = None
+    if "Volume" in hist.columns:
+        last_volume = hist["Volume"].to_numpy(dtype=np.float64)[has_close][-1]
+        if not np.isnan(last_volume):
+            volume = int(last_volume)
+
+    change = None
+    change_pct = None
+    if prev is not None and prev > 0:
+        change = current - prev
+        change_pct = change / prev * 100
+
+    return {
+        "price": current,
+        "prev_close": prev,
+        "change": change,
+        "change_pct": change_pct,
+        "volume": volume,
+    }
 
 
 class PriceCacheService:
@@ -47,14 +107,21 @@ class PriceCacheService:
 
     def __init__(self) -> None:
         self._cache: dict[str, CachedPrice] = {}
-        self._last_refresh: datetime | None = None
-        self._refreshing: bool = False
+        # Epoch nanoseconds; formatted only at the API boundary
+        self._last_refresh_ns: int | None = None
+        self._refresh_lock: asyncio.Lock | None = None
         self.refresh_interval: int = 1800  # 30 minutes
+        # Bumped on every cache write; keys the memoised read payloads below
+        # so status polls reuse them until prices actually change.
+        self._version: int = 0
+        self._status_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+        self._payload_cache: tuple[int, dict[str, dict[str, Any]]] | None = None
 
     @classmethod
     def get_instance(cls) -> PriceCacheService:
         if cls._instance is None:
             cls._instance = cls()
+            cls._instance._load_snapshot()
         return cls._instance
 
     # ------------------------------------------------------------------
@@ -63,11 +130,13 @@ class PriceCacheService:
 
     @property
     def last_refresh(self) -> datetime | None:
-        return self._last_refresh
+        if self._last_refresh_ns is None:
+            return None
+        return _utc_datetime(self._last_refresh_ns)
 
     @property
     def is_refreshing(self) -> bool:
-        return self._refreshing
+        return self._refresh_lock is not None and self._refresh_lock.locked()
 
     def get_price(self, ticker: str) -> CachedPrice | None:
         return self._cache.get(ticker)
@@ -79,14 +148,57 @@ class PriceCacheService:
         return dict(self._cache)
 
     def get_status(self) -> dict[str, Any]:
-        return {
-            "tickers_cached": len(self._cache),
-            "last_refresh": (
-                self._last_refresh.isoformat() + "Z" if self._last_refresh else None
-            ),
-            "is_refreshing": self._refreshing,
-            "refresh_interval_seconds": self.refresh_interval,
-        }
+        """Cache summary; the returned dict is shared and must not be mutated."""
+        key = (self._version, self.is_refreshing, self.refresh_interval)
+        if self._status_cache is None or self._status_cache[0] != key:
+            self._status_cache = (key, {
+                "tickers_cached": len(self._cache),
+                "last_refresh": (
+                    self.last_refresh.isoformat() + "Z"
+                    if self._last_refresh_ns is not None
+                    else None
+                ),
+                "is_refreshing": self.is_refreshing,
+                "refresh_interval_seconds": self.refresh_interval,
+            })
+        return self._status_cache[1]
+
+    def get_prices_payload(self) -> dict[str, dict[str, Any]]:
+        """Every cached price as JSON-ready dicts, rebuilt only after a write.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        if self._payload_cache is None or self._payload_cache[0] != self._version:
+            self._payload_cache = (self._version, {
+                ticker: {
+                    "price": cp.price,
+                    "prev_close": cp.prev_close,
+                    "change": cp.change,
+                    "change_pct": cp.change_pct,
+                    "volume": cp.volume,
+                    "updated_at": _utc_datetime(cp.updated_at_ns).isoformat() + "Z",
+                }
+                for ticker, cp in self._cache.items()
+            })
+        return self._payload_cache[1]
+
+    async def get_or_fetch(self, tickers: list[str]) -> dict[str, CachedPrice]:
+        """Return prices for *tickers*, fetching only those missing or stale.
+
+        An entry is fresh if it was updated within ``refresh_interval``, so
+        on the warm path this makes no network calls.  Fetched prices are
+        added to the shared cache but not written to the DB; that stays the
+        job of ``refresh_prices``.
+        """
+        cutoff_ns = time.time_ns() - self.refresh_interval * 1_000_000_000
+        stale = [
+            t for t in dict.fromkeys(tickers)
+            if (cached := self._cache.get(t)) is None
+            or cached.updated_at_ns < cutoff_ns
+        ]
+        if stale:
+            self._store(await self._batch_fetch_prices(stale), time.time_ns())
+        return self.get_prices(tickers)
 
     # ------------------------------------------------------------------
     # Refresh logic
@@ -104,11 +216,23 @@ class PriceCacheService:
         Returns:
             The full cache dict after the refresh.
         """
-        if self._refreshing:
+        if self._lock.locked():
             logger.info("Price refresh already in progress, skipping")
             return self._cache
 
-        self._refreshing = True
+        async with self._lock, self._cross_process_lock() as acquired:
+            if acquired:
+                return await self._refresh(tickers)
+            # Another worker just refreshed and wrote the shared snapshot;
+            # take its prices rather than downloading them all again.
+            logger.info("Price refresh ran in another worker, loading its snapshot")
+            await asyncio.to_thread(self._load_snapshot)
+            if tickers:
+                await self.get_or_fetch(tickers)
+            return self._cache
+
+    async def _refresh(self, tickers: list[str] | None) -> dict[str, CachedPrice]:
+        """Body of ``refresh_prices``; callers must hold ``_lock``."""
         try:
             if tickers is None:
                 tickers = await self._get_all_portfolio_tickers()
@@ -118,28 +242,24 @@ class PriceCacheService:
                 return self._cache
 
             logger.info("Refreshing prices for %d tickers: %s", len(tickers), tickers)
-            prices = await self._batch_fetch_prices(tickers)
-
-            now = datetime.utcnow()
-            updated = 0
-            for ticker, data in prices.items():
-                if data is not None:
-                    self._cache[ticker] = CachedPrice(
-                        ticker=ticker,
-                        price=data["price"],
-                        prev_close=data.get("prev_close"),
-                        change=data.get("change"),
-                        change_pct=data.get("change_pct"),
-                        volume=data.get("volume"),
-                        updated_at=now,
-                    )
-                    updated += 1
 
-            self._last_refresh = now
+            # Download chunks in the background while earlier chunks are
+            # written to Position / Portfolio rows.
+            queue: asyncio.Queue[dict[str, dict[str, Any] | None] | None] = (
+                asyncio.Queue()
+            )
+            producer = asyncio.create_task(self._produce_prices(tickers, queue))
+            try:
+                updated = await self._consume_prices(queue)
+            finally:
+                if not producer.done():
+                    producer.cancel()
+            await producer
+
+            self._last_refresh_ns = time.time_ns()
+            self._version += 1
             logger.info("Price cache refreshed: %d/%d tickers updated", updated, len(tickers))
-
-            # Persist updated prices to Position / Portfolio rows
-            await self._update_portfolio_positions()
+            await asyncio.to_thread(self._save_snapshot)
 
             # Record daily portfolio snapshots for history chart
             await self._record_portfolio_snapshots()
@@ -148,13 +268,251 @@ class PriceCacheService:
         except Exception:
             logger.exception("Error during price refresh")
             return self._cache
+
+    @asynccontextmanager
+    async def _cross_process_lock(self) -> AsyncIterator[bool]:
+        """Hold a Postgres advisory lock so one worker refreshes at a time.
+
+        If another process holds it, waits for that refresh to finish and
+        yields False; the caller then loads the snapshot it wrote.  Yields
+        True without locking on other databases, or if the lock query itself
+        fails, so a DB hiccup never blocks refreshing the in-memory cache.
+        The lock is session-scoped, so one connection is held for the whole
+        refresh.
+        """
+        from sqlalchemy import text
+
+        from src.models.base import engine
+
+        if engine.dialect.name != "postgresql":
+            yield True
+            return
+
+        try:
+            conn = await engine.connect()
+        except Exception:
+            logger.warning("Could not connect for refresh lock", exc_info=True)
+            yield True
+            return
+
+        try:
+            try:
+                acquired = (await conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": _REFRESH_ADVISORY_LOCK},
+                )).scalar()
+            except Exception:
+                logger.warning("Refresh advisory lock query failed", exc_info=True)
+                yield True
+                return
+
+            if not acquired:
+                await self._wait_for_lock_holder(conn)
+
+            try:
+                yield bool(acquired)
+            finally:
+                if acquired:
+                    try:
+                        await conn.execute(
+                            text("SELECT pg_advisory_unlock(:key)"),
+                            {"key": _REFRESH_ADVISORY_LOCK},
+                        )
+                    except Exception:
+                        # Don't hand a connection still holding the lock
+                        # back to the pool.
+                        logger.warning("Refresh advisory unlock failed", exc_info=True)
+                        await conn.invalidate()
+        finally:
+            await conn.close()
+
+    # How long a worker that lost the refresh lock waits for the holder to
+    # finish, polling every REFRESH_WAIT_POLL seconds.
+    REFRESH_WAIT_TIMEOUT = 120.0
+    REFRESH_WAIT_POLL = 1.0
+
+    async def _wait_for_lock_holder(self, conn: Any) -> None:
+        """Poll until the worker holding the refresh advisory lock releases it.
+
+        A shared lock is only granted once the holder's exclusive one is
+        gone; it is released again straight away.
+        """
+        from sqlalchemy import text
+
+        params = {"key": _REFRESH_ADVISORY_LOCK}
+        try:
+            async with asyncio.timeout(self.REFRESH_WAIT_TIMEOUT):
+                while not (await conn.execute(
+                    text("SELECT pg_try_advisory_lock_shared(:key)"), params,
+                )).scalar():
+                    await asyncio.sleep(self.REFRESH_WAIT_POLL)
+            await conn.execute(text("SELECT pg_advisory_unlock_shared(:key)"), params)
+        except TimeoutError:
+            logger.warning(
+                "Price refresh in another worker still running after %gs",
+                self.REFRESH_WAIT_TIMEOUT,
+            )
+        except Exception:
+            logger.warning("Waiting for the refresh lock holder failed", exc_info=True)
+
+    # Tickers are downloaded REFRESH_CHUNK_SIZE at a time.  Fetched prices
+    # are written to the DB in batches of up to REFRESH_BATCH_SIZE priced
+    # tickers, waiting at most REFRESH_MAX_WAIT seconds for a batch to fill.
+    # Chunks are smaller than batches so that chunks downloaded during one
+    # write are merged into the next.
+    REFRESH_CHUNK_SIZE = 8
+    REFRESH_BATCH_SIZE = 32
+    REFRESH_MAX_WAIT = 0.5
+
+    async def _produce_prices(
+        self,
+        tickers: list[str],
+        queue: asyncio.Queue[dict[str, dict[str, Any] | None] | None],
+    ) -> None:
+        """Fetch *tickers* chunk by chunk onto *queue*, then a ``None`` sentinel.
+
+        Chunks run one after another; ``download`` serialises ``yf.download``
+        across the process anyway (see ``src.data.sources.yahoo_download``).
+        """
+        try:
+            for start in range(0, len(tickers), self.REFRESH_CHUNK_SIZE):
+                chunk = tickers[start:start + self.REFRESH_CHUNK_SIZE]
+                await queue.put(await self._batch_fetch_prices(chunk))
         finally:
-            self._refreshing = False
+            queue.put_nowait(None)
+
+    async def _consume_prices(
+        self,
+        queue: asyncio.Queue[dict[str, dict[str, Any] | None] | None],
+    ) -> int:
+        """Cache fetched prices and persist them in coalesced batches.
+
+        Returns the number of tickers that got a price.
+        """
+        loop = asyncio.get_running_loop()
+        updated = 0
+        done = False
+        while not done:
+            first = await queue.get()
+            if first is None:
+                break
+            pending = dict(first)
+            # Tickers that came back without a price don't fill the batch.
+            priced = sum(data is not None for data in first.values())
+            deadline = loop.time() + self.REFRESH_MAX_WAIT
+            while priced < self.REFRESH_BATCH_SIZE:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        more = await queue.get()
+                except TimeoutError:
+                    break
+                if more is None:
+                    done = True
+                    break
+                pending.update(more)
+                priced += sum(data is not None for data in more.values())
+
+            stored = self._store(pending, time.time_ns())
+            updated += stored
+            if stored:
+                await self._update_portfolio_positions(
+                    [t for t, data in pending.items() if data is not None]
+                )
+        return updated
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @property
+    def _lock(self) -> asyncio.Lock:
+        """Refresh lock, created on first use so the singleton can be built
+        outside a running event loop."""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        return self._refresh_lock
+
+    # ------------------------------------------------------------------
+    # Disk snapshot, so a restarted process begins with a warm cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _snapshot_path() -> Path | None:
+        return Path(settings.price_cache_file) if settings.price_cache_file else None
+
+    def _save_snapshot(self) -> None:
+        """Write the cache to disk atomically (temp file + ``os.replace``)."""
+        path = self._snapshot_path()
+        if path is None:
+            return
+        payload = {
+            "last_refresh_ns": self._last_refresh_ns,
+            "prices": [asdict(c) for c in self._cache.values()],
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload))
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Could not write price cache snapshot to %s", path, exc_info=True)
+
+    def _load_snapshot(self) -> None:
+        """Seed the cache from disk if the snapshot is within ``refresh_interval``.
+
+        Entries keep their original ``updated_at_ns``, so ``get_or_fetch`` still
+        refetches anything that has gone stale since.
+        """
+        path = self._snapshot_path()
+        if path is None:
+            return
+        try:
+            if time.time() - path.stat().st_mtime > self.refresh_interval:
+                return
+            payload = json.loads(path.read_text())
+            cache = {
+                entry["ticker"]: CachedPrice(**entry) for entry in payload["prices"]
+            }
+            last_refresh_ns = payload.get("last_refresh_ns")
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable price cache snapshot %s", path, exc_info=True)
+            return
+
+        # Keep anything this process fetched more recently than the snapshot.
+        for ticker, entry in cache.items():
+            current = self._cache.get(ticker)
+            if current is None or current.updated_at_ns < entry.updated_at_ns:
+                self._cache[ticker] = entry
+        self._version += 1
+        if last_refresh_ns is not None and (
+            self._last_refresh_ns is None or self._last_refresh_ns < last_refresh_ns
+        ):
+            self._last_refresh_ns = last_refresh_ns
+        logger.info("Loaded %d cached prices from %s", len(cache), path)
+
+    def _store(
+        self, prices: dict[str, dict[str, Any] | None], now_ns: int
+    ) -> int:
+        """Write fetched price dicts into the cache; return how many landed."""
+        updated = 0
+        for ticker, data in prices.items():
+            if data is not None:
+                self._cache[ticker] = CachedPrice(
+                    ticker=ticker,
+                    price=data["price"],
+                    prev_close=data.get("prev_close"),
+                    change=data.get("change"),
+                    change_pct=data.get("change_pct"),
+                    volume=data.get("volume"),
+                    updated_at_ns=now_ns,
+                )
+                updated += 1
+        if updated:
+            self._version += 1
+        return updated
+
     async def _get_all_portfolio_tickers(self) -> list[str]:
         """Return unique tickers from every position in the DB."""
         from sqlalchemy import distinct, select
@@ -172,131 +530,198 @@ class PriceCacheService:
             logger.warning("Could not query portfolio tickers", exc_info=True)
             return list(self._cache.keys())
 
+    # Worker cap for the per-ticker fallback; the work is pure network wait.
+    FALLBACK_WORKERS = 16
+
     async def _batch_fetch_prices(
         self, tickers: list[str]
     ) -> dict[str, dict[str, Any] | None]:
-        """Fetch current prices for multiple tickers via yfinance."""
+        """Fetch current prices for multiple tickers via yfinance.
+
+        All tickers go out in one ``yf.download`` call rather than one
+        ``Ticker.history`` round-trip each.  Tickers the batch misses are
+        retried individually on a thread pool.
+        """
+        import pandas as pd
         import yfinance as yf
 
-        def _fetch() -> dict[str, dict[str, Any] | None]:
-            results: dict[str, dict[str, Any] | None] = {}
-            for ticker in tickers:
-                try:
-                    t = yf.Ticker(ticker)
-                    hist = t.history(period="5d")
-                    if hist.empty:
-                        results[ticker] = None
-                        continue
+        from src.data.sources.yahoo_download import download
 
-                    current = float(hist["Close"].iloc[-1])
-                    prev = (
-                        float(hist["Close"].iloc[-2]) if len(hist) >= 2 else None
-                    )
-                    volume = (
-                        int(hist["Volume"].iloc[-1])
-                        if "Volume" in hist.columns
-                        else None
-                    )
+        def _one(ticker: str) -> dict[str, Any] | None:
+            try:
+                return _summarize_history(yf.Ticker(ticker).history(period="5d"))
+            except Exception:
+                logger.warning(
+                    "Failed to fetch price for %s", ticker, exc_info=True
+                )
+                return None
 
-                    change = None
-                    change_pct = None
-                    if prev is not None and prev > 0:
-                        change = current - prev
-                        change_pct = change / prev * 100
-
-                    results[ticker] = {
-                        "price": current,
-                        "prev_close": prev,
-                        "change": change,
-                        "change_pct": change_pct,
-                        "volume": volume,
-                    }
-                except Exception:
-                    logger.warning(
-                        "Failed to fetch price for %s", ticker, exc_info=True
-                    )
-                    results[ticker] = None
+        def _fetch() -> dict[str, dict[str, Any] | None]:
+            results: dict[str, dict[str, Any] | None] = dict.fromkeys(tickers)
+            try:
+                df = download(
+                    tickers, period="5d", group_by="ticker", threads=True,
+                    progress=False, auto_adjust=False,
+                )
+            except Exception:
+                logger.warning("Batch price download failed", exc_info=True)
+                df = pd.DataFrame()
+
+            if not df.empty:
+                for ticker in tickers:
+                    try:
+                        if isinstance(df.columns, pd.MultiIndex):
+                            if ticker not in df.columns.get_level_values(0):
+                                continue
+                            hist = df[ticker]
+                        else:
+                            # Older yfinance returns a flat frame for a single ticker.
+                            hist = df
+                        results[ticker] = _summarize_history(hist)
+                    except Exception:
+                        logger.warning(
+                            "Failed to read price for %s", ticker, exc_info=True
+                        )
+
+            missing = [t for t, data in results.items() if data is None]
+            if missing:
+                workers = min(self.FALLBACK_WORKERS, len(missing))
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    results.update(zip(missing, ex.map(_one, missing)))
             return results
 
         return await asyncio.to_thread(_fetch)
 
-    async def _update_portfolio_positions(self) -> None:
-        """Write cached prices into Position rows and recalculate Portfolio totals."""
-        from sqlalchemy import select
+    async def _update_portfolio_positions(
+        self, tickers: list[str] | None = None
+    ) -> None:
+        """Write cached prices into Position rows and recalculate Portfolio totals.
+
+        Reads plain column rows rather than ORM objects and writes back with
+        one bulk UPDATE per table, instead of per-row unit-of-work flushes.
+        If *tickers* is given, only portfolios holding one of them are
+        touched.
+        """
+        from sqlalchemy import func, select, update
 
         from src.models.base import async_session_factory
         from src.models.portfolio import Portfolio, Position
 
         try:
             async with async_session_factory() as session:
-                # Update every position with cached prices
-                result = await session.execute(select(Position))
-                positions = result.scalars().all()
+                stmt = select(
+                    Position.id,
+                    Position.portfolio_id,
+                    Position.ticker,
+                    Position.direction,
+                    Position.quantity,
+                    Position.avg_entry_price,
+                    Position.market_value,
+                    Position.pnl,
+                    Position.pnl_pct,
+                )
+                if tickers is not None:
+                    stmt = stmt.where(
+                        Position.portfolio_id.in_(
+                            select(Position.portfolio_id).where(
+                                Position.ticker.in_(tickers)
+                            )
+                        )
+                    )
+                result = await session.execute(stmt)
 
+                # Per portfolio: (id, market_value) of each position, for weights
+                by_portfolio: dict[str, list[tuple[str, float | None]]] = (
+                    defaultdict(list)
+                )
+                price_rows: list[dict[str, Any]] = []
                 portfolio_ids: set[str] = set()
-                for pos in positions:
+                for pos in result:
                     cached = self._cache.get(pos.ticker)
                     if cached is None:
+                        by_portfolio[pos.portfolio_id].append(
+                            (pos.id, pos.market_value)
+                        )
                         continue
 
-                    pos.current_price = cached.price
-                    pos.market_value = (pos.quantity or 0) * cached.price
-
+                    qty = pos.quantity or 0
                     entry = pos.avg_entry_price or 0
+                    values: dict[str, Any] = {
+                        "id": pos.id,
+                        "current_price": cached.price,
+                        "market_value": qty * cached.price,
+                        "pnl": pos.pnl,
+                        "pnl_pct": pos.pnl_pct,
+                    }
                     if entry > 0:
-                        pnl = (cached.price - entry) * (pos.quantity or 0)
+                        pnl = (cached.price - entry) * qty
                         pnl_pct = (cached.price - entry) / entry * 100
                         if pos.direction == "short":
                             pnl = -pnl
                             pnl_pct = -pnl_pct
-                        pos.pnl = round(pnl, 2)
-                        pos.pnl_pct = round(pnl_pct, 4)
+                        values["pnl"] = round(pnl, 2)
+                        values["pnl_pct"] = round(pnl_pct, 4)
 
+                    price_rows.append(values)
                     portfolio_ids.add(pos.portfolio_id)
-
-                # Recalculate portfolio-level totals
-                for pid in portfolio_ids:
-                    port_result = await session.execute(
-                        select(Portfolio).where(Portfolio.id == pid)
-                    )
-                    portfolio = port_result.scalar_one_or_none()
-                    if portfolio is None:
-                        continue
-
-                    pos_result = await session.execute(
-                        select(Position).where(Position.portfolio_id == pid)
+                    by_portfolio[pos.portfolio_id].append(
+                        (pos.id, values["market_value"])
                     )
-                    port_positions = pos_result.scalars().all()
 
-                    total_market_value = sum(
-                        p.market_value or 0 for p in port_positions
+                if not price_rows:
+                    logger.info("Updated 0 portfolios with latest prices")
+                    return
+
+                await session.execute(update(Position), price_rows)
+
+                # Recalculate portfolio-level totals with one aggregate over
+                # the freshly written positions of every affected portfolio.
+                totals = await session.execute(
+                    select(
+                        Position.portfolio_id,
+                        Portfolio.cash,
+                        func.sum(func.coalesce(Position.market_value, 0)),
+                        func.sum(func.coalesce(Position.pnl, 0)),
+                        func.sum(
+                            func.coalesce(Position.avg_entry_price, 0)
+                            * func.coalesce(Position.quantity, 0)
+                        ),
                     )
-                    total_pnl = sum(p.pnl or 0 for p in port_positions)
-
-                    portfolio.invested = round(total_market_value, 2)
-                    portfolio.total_value = round(
-                        total_market_value + (portfolio.cash or 0), 2
-                    )
-                    portfolio.pnl = round(total_pnl, 2)
+                    .join(Portfolio, Portfolio.id == Position.portfolio_id)
+                    .where(Position.portfolio_id.in_(portfolio_ids))
+                    .group_by(Position.portfolio_id, Portfolio.cash)
+                )
+                portfolio_rows: list[dict[str, Any]] = []
+                weight_rows: list[dict[str, Any]] = []
+                for pid, cash, total_market_value, total_pnl, initial_invested in totals:
+                    total_value = round(total_market_value + (cash or 0), 2)
+                    portfolio_rows.append({
+                        "id": pid,
+                        "invested": round(total_market_value, 2),
+                        "total_value": total_value,
+                        "pnl": round(total_pnl, 2),
+                        "pnl_pct": (
+                            round(total_pnl / initial_invested * 100, 4)
+                            if initial_invested > 0
+                            else 0
+                        ),
+                    })
 
-                    initial_invested = sum(
-                        (p.avg_entry_price or 0) * (p.quantity or 0)
-                        for p in port_positions
-                    )
-                    portfolio.pnl_pct = (
-                        round(total_pnl / initial_invested * 100, 4)
-                        if initial_invested > 0
-                        else 0
+                    # Recalculate weights
+                    total_val = total_value or 1
+                    weight_rows.extend(
+                        {"id": pos_id, "weight": round((mv or 0) / total_val, 6)}
+                        for pos_id, mv in by_portfolio[pid]
                     )
 
-                    # Recalculate weights
-                    total_val = portfolio.total_value or 1
-                    for p in port_positions:
-                        p.weight = round((p.market_value or 0) / total_val, 6)
+                if portfolio_rows:
+                    await session.execute(update(Portfolio), portfolio_rows)
+                if weight_rows:
+                    await session.execute(update(Position), weight_rows)
 
                 await session.commit()
                 logger.info(
-                    "Updated %d portfolios with latest prices", len(portfolio_ids)
+                    "Updated %d portfolios with latest prices", len(portfolio_rows)
                 )
         except Exception:
             logger.exception("Error updating portfolio positions")
@@ -317,24 +742,37 @@ class PriceCacheService:
         try:
             async with async_session_factory() as session:
                 # Get all portfolios
-                result = await session.execute(select(Portfolio))
-                portfolios = result.scalars().all()
+                result = await session.execute(select(Portfolio.id, Portfolio.cash))
+                portfolios = result.all()
+
+                # Today's existing snapshots and every position, one query
+                # each, with positions read as plain column rows.
+                snap_result = await session.execute(
+                    select(PortfolioSnapshot).where(
+                        PortfolioSnapshot.snapshot_date == today
+                    )
+                )
+                snaps = {s.portfolio_id: s for s in snap_result.scalars()}
+
+                pos_result = await session.execute(
+                    select(
+                        Position.portfolio_id,
+                        Position.ticker,
+                        Position.direction,
+                        Position.quantity,
+                        Position.avg_entry_price,
+                        Position.current_price,
+                    )
+                )
+                by_portfolio: dict[str, list[Any]] = defaultdict(list)
+                for row in pos_result:
+                    by_portfolio[row.portfolio_id].append(row)
 
                 for p in portfolios:
-                    # Check if we already have a snapshot for today
-                    existing = await session.execute(
-                        select(PortfolioSnapshot)
-                        .where(PortfolioSnapshot.portfolio_id == p.id)
-                        .where(PortfolioSnapshot.snapshot_date == today)
-                    )
-                    snap = existing.scalar_one_or_none()
+                    snap = snaps.get(p.id)
+                    positions = by_portfolio[p.id]
 
                     # Compute current values
-                    pos_result = await session.execute(
-                        select(Position).where(Position.portfolio_id == p.id)
-                    )
-                    positions = pos_result.scalars().all()
-
                     total_mv = 0.0
                     total_pnl = 0.0
                     for pos in positions:
@@ -16,6 +16,7 @@ import pandas as pd
 import yfinance as yf
 
 from src.config import settings
+from src.data.sources.yahoo_download import download
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -151,7 +152,7 @@ class RiskService:
         start_date = (datetime.now() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
 
         def _download() -> pd.DataFrame:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+            data = download(ticker, start=start_date, end=end_date, progress=False)
             return data
 
         data = await asyncio.to_thread(_download)
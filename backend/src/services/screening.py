@@ -15,6 +15,7 @@ import pandas as pd
 import yfinance as yf
 
 from src.config import settings
+from src.data.sources.yahoo_download import download
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -118,7 +119,7 @@ class ScreeningService:
         """
 
         def _download() -> pd.DataFrame:
-            data = yf.download(ticker, period=period, progress=False)
+            data = download(ticker, period=period, progress=False)
             return data
 
         data = await asyncio.to_thread(_download)
@@ -93,13 +93,13 @@ async def backtest_momentum(
         ToolResult with backtest statistics.
     """
     try:
-        import yfinance as yf
+        from src.data.sources.yahoo_download import download
         import pandas as pd
         import numpy as np
 
         results = {}
         for ticker in tickers[:5]:  # Limit to 5 tickers
-            df = yf.download(ticker, period=f"{lookback_days}d", progress=False)
+            df = download(ticker, period=f"{lookback_days}d", progress=False)
             if df.empty or len(df) < 50:
                 results[ticker] = {"error": "Insufficient data"}
                 continue
@@ -185,13 +185,13 @@ async def backtest_mean_revert(
     - Compute win rate, average hold time, and return statistics
     """
     try:
-        import yfinance as yf
+        from src.data.sources.yahoo_download import download
         import pandas as pd
         import numpy as np
 
         results = {}
         for ticker in tickers[:5]:
-            df = yf.download(ticker, period=f"{lookback_days}d", progress=False)
+            df = download(ticker, period=f"{lookback_days}d", progress=False)
             if df.empty or len(df) < window + 10:
                 results[ticker] = {"error": "Insufficient data"}
                 continue
@@ -406,7 +406,7 @@ async def check_correlation(
 ) -> ToolResult:
     """Check correlation between tickers and optionally vs portfolio holdings."""
     try:
-        import yfinance as yf
+        from src.data.sources.yahoo_download import download
         import pandas as pd
 
         all_tickers = list(set(tickers + (portfolio_tickers or [])))
@@ -414,7 +414,7 @@ async def check_correlation(
             return ToolResult(tool_name="check_correlation", success=True,
                               data={"note": "Need at least 2 tickers for correlation"})
 
-        df = yf.download(" ".join(all_tickers), period=period, progress=False)
+        df = download(" ".join(all_tickers), period=period, progress=False)
         if df.empty:
             return ToolResult(tool_name="check_correlation", success=False, error="No price data")
 
@@ -448,12 +448,12 @@ async def check_correlation(
 async def get_historical_vol(tickers: list[str], window: int = 30) -> ToolResult:
     """Get historical volatility (annualized) for tickers."""
     try:
-        import yfinance as yf
+        from src.data.sources.yahoo_download import download
         import numpy as np
 
         results = {}
         for ticker in tickers[:10]:
-            df = yf.download(ticker, period="1y", progress=False)
+            df = download(ticker, period="1y", progress=False)
             if df.empty:
                 continue
             close = df["Close"].values.flatten()
@@ -481,10 +481,10 @@ async def get_historical_vol(tickers: list[str], window: int = 30) -> ToolResult
 async def get_price_levels(ticker: str) -> ToolResult:
     """Get key support/resistance levels and moving averages."""
     try:
-        import yfinance as yf
+        from src.data.sources.yahoo_download import download
         import pandas as pd
 
-        df = yf.download(ticker, period="1y", progress=False)
+        df = download(ticker, period="1y", progress=False)
         if df.empty:
             return ToolResult(tool_name="get_price_levels", success=False, error="No data")
 
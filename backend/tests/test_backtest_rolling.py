@@ -0,0 +1,67 @@
+"""Regression checks for the O(N) rolling statistics behind the mean reversion backtest."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.backtest import _rolling_mean_std
+
+
+def _flat_windows(values: np.ndarray, window: int) -> np.ndarray:
+    return np.array([
+        i >= window - 1 and np.ptp(values[i - window + 1 : i + 1]) == 0
+        for i in range(len(values))
+    ])
+
+
+def _series(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    values = 100 + rng.standard_normal(400).cumsum()
+    if seed % 3 == 1:
+        values[rng.integers(0, len(values), 5)] = np.nan
+    elif seed % 3 == 2:
+        start = rng.integers(0, 350)
+        values[start : start + rng.integers(5, 50)] = values[start]
+    return values
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 20, 60])
+@pytest.mark.parametrize("seed", range(12))
+def test_matches_pandas_rolling(seed: int, window: int) -> None:
+    values = _series(seed)
+    mean, std = _rolling_mean_std(values, window)
+    rolling = pd.Series(values).rolling(window)
+    expected_mean = rolling.mean().to_numpy()
+    expected_std = rolling.std().to_numpy()
+
+    np.testing.assert_allclose(mean, expected_mean, rtol=1e-9, atol=1e-7)
+    # pandas can leave a rounding residual on flat windows; those are checked below
+    flat = _flat_windows(values, window)
+    np.testing.assert_allclose(std[~flat], expected_std[~flat], rtol=1e-7, atol=1e-7)
+    assert (std[expected_std == 0] == 0).all()
+    if window > 1:
+        assert (std[flat] == 0).all()
+
+
+def test_flat_run_after_trend_has_no_z_score() -> None:
+    close = np.concatenate((
+        np.linspace(100, 120, 40), np.full(25, 120.0), np.linspace(120, 110, 40),
+    ))
+    mean, std = _rolling_mean_std(close, 20)
+
+    assert (std[58:66] == 0).all()
+    assert (mean[58:66] == 120.0).all()
+    with np.errstate(invalid="ignore"):
+        z_scores = (close - mean) / std
+    # 0 / 0: no signal, so an open position is neither entered nor exited on these bars
+    assert np.isnan(z_scores[58:66]).all()
+    assert np.isfinite(z_scores[66:]).all()
+
+
+def test_nan_only_blanks_its_own_windows() -> None:
+    values = 100 + np.random.default_rng(0).standard_normal(100).cumsum()
+    values[30] = np.nan
+    mean, std = _rolling_mean_std(values, 10)
+
+    assert np.isnan(mean[30:40]).all() and np.isnan(std[30:40]).all()
+    assert np.isfinite(mean[40:]).all() and np.isfinite(std[40:]).all()